@@ -488,6 +488,19 @@ extern "C"
       p_ai->get_init_multipliers(invec, n);
    }
 
+   void EXTERNAL_AmplInterface_get_all_init(AmplInterface *p_ai,
+                                            double *x_l, double *x_u,
+                                            double *g_l, double *g_u,
+                                            double *init_x, double *init_lam,
+                                            int n, int m) {
+      p_ai->get_lower_bounds_x(x_l, n);
+      p_ai->get_upper_bounds_x(x_u, n);
+      p_ai->get_lower_bounds_g(g_l, m);
+      p_ai->get_upper_bounds_g(g_u, m);
+      p_ai->get_init_x(init_x, n);
+      p_ai->get_init_multipliers(init_lam, m);
+   }
+
    bool EXTERNAL_AmplInterface_eval_f(AmplInterface *p_ai, double *invec, int n, double& f) {
       return p_ai->eval_f(invec, n, f);
    }
@@ -500,6 +513,17 @@ extern "C"
       return p_ai->eval_g(const_x, nx, g, ng);
    }
 
+   bool EXTERNAL_AmplInterface_eval_g_batch(AmplInterface *p_ai, double *const_X, int k, int nx,
+                                            double *G, int ng) {
+      // X is a row-major (k x nx) array and G a row-major (k x ng) array
+      for (int i = 0; i < k; i++) {
+         if (!p_ai->eval_g(const_X + (size_t) i * nx, nx, G + (size_t) i * ng, ng)) {
+            return false;
+         }
+      }
+      return true;
+   }
+
    void EXTERNAL_AmplInterface_struct_jac_g(AmplInterface *p_ai, int *irow, int *jcol, int nnz_jac_g) {
       p_ai->struct_jac_g(irow, jcol, nnz_jac_g);
    }
@@ -514,6 +538,13 @@ extern "C"
       p_ai->struct_hes_lag(irow, jcol, nnz_hes_lag);
    }
 
+   void EXTERNAL_AmplInterface_get_all_structure(AmplInterface *p_ai,
+                                                 int *irow_jac, int *jcol_jac, int nnz_jac_g,
+                                                 int *irow_hes, int *jcol_hes, int nnz_hes_lag) {
+      p_ai->struct_jac_g(irow_jac, jcol_jac, nnz_jac_g);
+      p_ai->struct_hes_lag(irow_hes, jcol_hes, nnz_hes_lag);
+   }
+
    bool EXTERNAL_AmplInterface_eval_hes_lag(AmplInterface *p_ai, double *const_x, int nx,
                                             double *const_lam, int nc, double *hes_lag,
                                             int nnz_hes_lag, double obj_factor) {
@@ -16,6 +16,248 @@ import ctypes
 import sys
 import os
 
+# define 1d array (inputs may be read-only, ASL writes into the outputs)
+array_1d_double = npct.ndpointer(dtype=np.double, ndim=1, flags='C_CONTIGUOUS,ALIGNED')
+array_1d_double_out = npct.ndpointer(dtype=np.double, ndim=1,
+                                     flags='C_CONTIGUOUS,ALIGNED,WRITEABLE')
+array_1d_int_out = npct.ndpointer(dtype=np.intc, ndim=1,
+                                  flags='C_CONTIGUOUS,ALIGNED,WRITEABLE')
+array_2d_double = npct.ndpointer(dtype=np.double, ndim=2, flags='C_CONTIGUOUS,ALIGNED')
+array_2d_double_out = npct.ndpointer(dtype=np.double, ndim=2,
+                                     flags='C_CONTIGUOUS,ALIGNED,WRITEABLE')
+
+# the ASL library is loaded (and its prototypes declared) only once
+_ASL_LIB = None
+_ASL_FUTURE_LIBRARIES = False
+
+
+def _bind_signatures(lib):
+    """
+    Declares the argument and return types of the functions exported
+    by libpynumero_ASL. Returns True if the library supports the
+    objective factor in the evaluation of the Hessian of the Lagrangian
+    """
+    # constructor
+    lib.EXTERNAL_AmplInterface_new.argtypes = [ctypes.c_char_p]
+    lib.EXTERNAL_AmplInterface_new.restype = ctypes.c_void_p
+
+    lib.EXTERNAL_AmplInterface_new_file.argtypes = [ctypes.c_char_p]
+    lib.EXTERNAL_AmplInterface_new_file.restype = ctypes.c_void_p
+
+    # number of variables
+    lib.EXTERNAL_AmplInterface_n_vars.argtypes = [ctypes.c_void_p]
+    lib.EXTERNAL_AmplInterface_n_vars.restype = ctypes.c_int
+
+    # number of constraints
+    lib.EXTERNAL_AmplInterface_n_constraints.argtypes = [ctypes.c_void_p]
+    lib.EXTERNAL_AmplInterface_n_constraints.restype = ctypes.c_int
+
+    # number of nonzeros in jacobian
+    lib.EXTERNAL_AmplInterface_nnz_jac_g.argtypes = [ctypes.c_void_p]
+    lib.EXTERNAL_AmplInterface_nnz_jac_g.restype = ctypes.c_int
+
+    # number of nonzeros in hessian of lagrangian
+    lib.EXTERNAL_AmplInterface_nnz_hessian_lag.argtypes = [ctypes.c_void_p]
+    lib.EXTERNAL_AmplInterface_nnz_hessian_lag.restype = ctypes.c_int
+
+    # lower bounds on x
+    lib.EXTERNAL_AmplInterface_x_lower_bounds.argtypes = [ctypes.c_void_p,
+                                                          array_1d_double_out,
+                                                          ctypes.c_int]
+    lib.EXTERNAL_AmplInterface_x_lower_bounds.restype = None
+
+    # upper bounds on x
+    lib.EXTERNAL_AmplInterface_x_upper_bounds.argtypes = [ctypes.c_void_p,
+                                                          array_1d_double_out,
+                                                          ctypes.c_int]
+    lib.EXTERNAL_AmplInterface_x_upper_bounds.restype = None
+
+    # lower bounds on g
+    lib.EXTERNAL_AmplInterface_g_lower_bounds.argtypes = [ctypes.c_void_p,
+                                                          array_1d_double_out,
+                                                          ctypes.c_int]
+    lib.EXTERNAL_AmplInterface_g_lower_bounds.restype = None
+
+    # upper bounds on g
+    lib.EXTERNAL_AmplInterface_g_upper_bounds.argtypes = [ctypes.c_void_p,
+                                                          array_1d_double_out,
+                                                          ctypes.c_int]
+    lib.EXTERNAL_AmplInterface_g_upper_bounds.restype = None
+
+    # initial value x
+    lib.EXTERNAL_AmplInterface_get_init_x.argtypes = [ctypes.c_void_p,
+                                                      array_1d_double_out,
+                                                      ctypes.c_int]
+    lib.EXTERNAL_AmplInterface_get_init_x.restype = None
+
+    # initial value multipliers
+    lib.EXTERNAL_AmplInterface_get_init_multipliers.argtypes = [ctypes.c_void_p,
+                                                                array_1d_double_out,
+                                                                ctypes.c_int]
+    lib.EXTERNAL_AmplInterface_get_init_multipliers.restype = None
+
+    # bounds and initial values in a single call (newer pynumero_libraries only)
+    if hasattr(lib, 'EXTERNAL_AmplInterface_get_all_init'):
+        lib.EXTERNAL_AmplInterface_get_all_init.argtypes = [ctypes.c_void_p,
+                                                            array_1d_double_out,
+                                                            array_1d_double_out,
+                                                            array_1d_double_out,
+                                                            array_1d_double_out,
+                                                            array_1d_double_out,
+                                                            array_1d_double_out,
+                                                            ctypes.c_int,
+                                                            ctypes.c_int]
+        lib.EXTERNAL_AmplInterface_get_all_init.restype = None
+
+    # evaluate objective
+    lib.EXTERNAL_AmplInterface_eval_f.argtypes = [ctypes.c_void_p,
+                                                  array_1d_double,
+                                                  ctypes.c_int,
+                                                  ctypes.POINTER(ctypes.c_double)]
+    lib.EXTERNAL_AmplInterface_eval_f.restype = ctypes.c_bool
+
+    # gradient objective
+    lib.EXTERNAL_AmplInterface_eval_deriv_f.argtypes = [ctypes.c_void_p,
+                                                        array_1d_double,
+                                                        array_1d_double_out,
+                                                        ctypes.c_int]
+    lib.EXTERNAL_AmplInterface_eval_deriv_f.restype = ctypes.c_bool
+
+    # structure jacobian of constraints
+    lib.EXTERNAL_AmplInterface_struct_jac_g.argtypes = [ctypes.c_void_p,
+                                                        array_1d_int_out,
+                                                        array_1d_int_out,
+                                                        ctypes.c_int]
+    lib.EXTERNAL_AmplInterface_struct_jac_g.restype = None
+
+    # structure hessian of Lagrangian
+    lib.EXTERNAL_AmplInterface_struct_hes_lag.argtypes = [ctypes.c_void_p,
+                                                          array_1d_int_out,
+                                                          array_1d_int_out,
+                                                          ctypes.c_int]
+    lib.EXTERNAL_AmplInterface_struct_hes_lag.restype = None
+
+    # structure of jacobian and hessian in a single call (newer pynumero_libraries only)
+    if hasattr(lib, 'EXTERNAL_AmplInterface_get_all_structure'):
+        lib.EXTERNAL_AmplInterface_get_all_structure.argtypes = [ctypes.c_void_p,
+                                                                 array_1d_int_out,
+                                                                 array_1d_int_out,
+                                                                 ctypes.c_int,
+                                                                 array_1d_int_out,
+                                                                 array_1d_int_out,
+                                                                 ctypes.c_int]
+        lib.EXTERNAL_AmplInterface_get_all_structure.restype = None
+
+    # evaluate constraints
+    lib.EXTERNAL_AmplInterface_eval_g.argtypes = [ctypes.c_void_p,
+                                                  array_1d_double,
+                                                  ctypes.c_int,
+                                                  array_1d_double_out,
+                                                  ctypes.c_int]
+    lib.EXTERNAL_AmplInterface_eval_g.restype = ctypes.c_bool
+
+    # evaluate constraints at several points (newer pynumero_libraries only)
+    if hasattr(lib, 'EXTERNAL_AmplInterface_eval_g_batch'):
+        lib.EXTERNAL_AmplInterface_eval_g_batch.argtypes = [ctypes.c_void_p,
+                                                            array_2d_double,
+                                                            ctypes.c_int,
+                                                            ctypes.c_int,
+                                                            array_2d_double_out,
+                                                            ctypes.c_int]
+        lib.EXTERNAL_AmplInterface_eval_g_batch.restype = ctypes.c_bool
+
+    # evaluate jacobian constraints
+    lib.EXTERNAL_AmplInterface_eval_jac_g.argtypes = [ctypes.c_void_p,
+                                                      array_1d_double,
+                                                      ctypes.c_int,
+                                                      array_1d_double_out,
+                                                      ctypes.c_int]
+    lib.EXTERNAL_AmplInterface_eval_jac_g.restype = ctypes.c_bool
+
+    # temporary try/except block while changes get merged in pynumero_libraries
+    try:
+        lib.EXTERNAL_AmplInterface_dummy.argtypes = [ctypes.c_void_p]
+        lib.EXTERNAL_AmplInterface_dummy.restype = None
+        # evaluate hessian Lagrangian
+        lib.EXTERNAL_AmplInterface_eval_hes_lag.argtypes = [ctypes.c_void_p,
+                                                            array_1d_double,
+                                                            ctypes.c_int,
+                                                            array_1d_double,
+                                                            ctypes.c_int,
+                                                            array_1d_double_out,
+                                                            ctypes.c_int,
+                                                            ctypes.c_double]
+        lib.EXTERNAL_AmplInterface_eval_hes_lag.restype = ctypes.c_bool
+        future_libraries = True
+    except Exception:
+        # evaluate hessian Lagrangian
+        lib.EXTERNAL_AmplInterface_eval_hes_lag.argtypes = [ctypes.c_void_p,
+                                                            array_1d_double,
+                                                            ctypes.c_int,
+                                                            array_1d_double,
+                                                            ctypes.c_int,
+                                                            array_1d_double_out,
+                                                            ctypes.c_int]
+        lib.EXTERNAL_AmplInterface_eval_hes_lag.restype = ctypes.c_bool
+        future_libraries = False
+
+    # finalize solution
+    lib.EXTERNAL_AmplInterface_finalize_solution.argtypes = [ctypes.c_void_p,
+                                                             ctypes.c_int,
+                                                             ctypes.c_char_p,
+                                                             array_1d_double,
+                                                             ctypes.c_int,
+                                                             array_1d_double,
+                                                             ctypes.c_int]
+    lib.EXTERNAL_AmplInterface_finalize_solution.restype = None
+
+    # destructor
+    lib.EXTERNAL_AmplInterface_free_memory.argtypes = [ctypes.c_void_p]
+    lib.EXTERNAL_AmplInterface_free_memory.restype = None
+
+    return future_libraries
+
+
+def _check_double(a, n, fname):
+    """
+    Checks that a is an array of n doubles. Only called when running
+    without optimizations (python -O strips all the calls)
+    """
+    assert a.size == n, "Error: Dimension missmatch."
+    assert a.dtype == np.double, \
+        "Error: array type. Function {} expects an array of type double".format(fname)
+
+
+def _as_bytes(data):
+    """
+    Returns data as a bytes object. Data that is already bytes is
+    passed through without copying
+    """
+    if isinstance(data, bytes):
+        return data
+    if isinstance(data, bytearray):
+        return bytes(data)
+    return data.encode('utf-8')
+
+
+def _load_asl():
+    """
+    Returns the ASL library with all its prototypes declared. The
+    library is loaded and configured the first time this is called
+    """
+    global _ASL_LIB, _ASL_FUTURE_LIBRARIES
+    if _ASL_LIB is None:
+        # RTLD_NODELETE keeps the library (and the ASL state) mapped for
+        # the life of the process even if it gets loaded again elsewhere
+        mode = ctypes.DEFAULT_MODE | getattr(os, 'RTLD_NODELETE', 0)
+        # foreign functions of a CDLL (unlike a PyDLL) release the GIL
+        # for the duration of the call, so evaluations of different
+        # AmplInterface objects can run concurrently from Python threads
+        lib = ctypes.CDLL(AmplInterface.libname, mode=mode)
+        _ASL_FUTURE_LIBRARIES = _bind_signatures(lib)
+        _ASL_LIB = lib
+    return _ASL_LIB
+
 
 class AmplInterface(object):
 
@@ -36,204 +278,63 @@ class AmplInterface(object):
         if nl_buffer is not None:
             raise NotImplementedError("AmplInterface only supported form NL-file for now")
 
-        self.ASLib = ctypes.cdll.LoadLibrary(AmplInterface.libname)
-
-        # define 1d array
-        array_1d_double = npct.ndpointer(dtype=np.double, ndim=1, flags='CONTIGUOUS')
-        array_1d_int = npct.ndpointer(dtype=np.intc, ndim=1, flags='CONTIGUOUS')
-
-        # constructor
-        self.ASLib.EXTERNAL_AmplInterface_new.argtypes = [ctypes.c_char_p]
-        self.ASLib.EXTERNAL_AmplInterface_new.restype = ctypes.c_void_p
-
-        self.ASLib.EXTERNAL_AmplInterface_new_file.argtypes = [ctypes.c_char_p]
-        self.ASLib.EXTERNAL_AmplInterface_new_file.restype = ctypes.c_void_p
-
-        #self.ASLib.EXTERNAL_AmplInterface_new_str.argtypes = [ctypes.c_char_p]
-        #self.ASLib.EXTERNAL_AmplInterface_new_str.restype = ctypes.c_void_p
-
-        # number of variables
-        self.ASLib.EXTERNAL_AmplInterface_n_vars.argtypes = [ctypes.c_void_p]
-        self.ASLib.EXTERNAL_AmplInterface_n_vars.restype = ctypes.c_int
-
-        # number of constraints
-        self.ASLib.EXTERNAL_AmplInterface_n_constraints.argtypes = [ctypes.c_void_p]
-        self.ASLib.EXTERNAL_AmplInterface_n_constraints.restype = ctypes.c_int
-
-        # number of nonzeros in jacobian
-        self.ASLib.EXTERNAL_AmplInterface_nnz_jac_g.argtypes = [ctypes.c_void_p]
-        self.ASLib.EXTERNAL_AmplInterface_nnz_jac_g.restype = ctypes.c_int
-
-        # number of nonzeros in hessian of lagrangian
-        self.ASLib.EXTERNAL_AmplInterface_nnz_hessian_lag.argtypes = [ctypes.c_void_p]
-        self.ASLib.EXTERNAL_AmplInterface_nnz_hessian_lag.restype = ctypes.c_int
-
-        # lower bounds on x
-        self.ASLib.EXTERNAL_AmplInterface_x_lower_bounds.argtypes = [ctypes.c_void_p,
-                                                                     array_1d_double,
-                                                                     ctypes.c_int]
-        self.ASLib.EXTERNAL_AmplInterface_x_lower_bounds.restype = None
-
-        # upper bounds on x
-        self.ASLib.EXTERNAL_AmplInterface_x_upper_bounds.argtypes = [ctypes.c_void_p,
-                                                                     array_1d_double,
-                                                                     ctypes.c_int]
-        self.ASLib.EXTERNAL_AmplInterface_x_upper_bounds.restype = None
-
-        # lower bounds on g
-        self.ASLib.EXTERNAL_AmplInterface_g_lower_bounds.argtypes = [ctypes.c_void_p,
-                                                                     array_1d_double,
-                                                                     ctypes.c_int]
-        self.ASLib.EXTERNAL_AmplInterface_g_lower_bounds.restype = None
-
-        # upper bounds on g
-        self.ASLib.EXTERNAL_AmplInterface_g_upper_bounds.argtypes = [ctypes.c_void_p,
-                                                                     array_1d_double,
-                                                                     ctypes.c_int]
-        self.ASLib.EXTERNAL_AmplInterface_g_upper_bounds.restype = None
-
-        # initial value x
-        self.ASLib.EXTERNAL_AmplInterface_get_init_x.argtypes = [ctypes.c_void_p,
-                                                                 array_1d_double,
-                                                                 ctypes.c_int]
-        self.ASLib.EXTERNAL_AmplInterface_get_init_x.restype = None
-
-        # initial value multipliers
-        self.ASLib.EXTERNAL_AmplInterface_get_init_multipliers.argtypes = [ctypes.c_void_p,
-                                                                           array_1d_double,
-                                                                           ctypes.c_int]
-        self.ASLib.EXTERNAL_AmplInterface_get_init_multipliers.restype = None
-
-        # evaluate objective
-        self.ASLib.EXTERNAL_AmplInterface_eval_f.argtypes = [ctypes.c_void_p,
-                                                             array_1d_double,
-                                                             ctypes.c_int,
-                                                             ctypes.POINTER(ctypes.c_double)]
-        self.ASLib.EXTERNAL_AmplInterface_eval_f.restype = ctypes.c_bool
-
-        # gradient objective
-        self.ASLib.EXTERNAL_AmplInterface_eval_deriv_f.argtypes = [ctypes.c_void_p,
-                                                                   array_1d_double,
-                                                                   array_1d_double,
-                                                                   ctypes.c_int]
-        self.ASLib.EXTERNAL_AmplInterface_eval_deriv_f.restype = ctypes.c_bool
-
-        # structure jacobian of constraints
-        self.ASLib.EXTERNAL_AmplInterface_struct_jac_g.argtypes = [ctypes.c_void_p,
-                                                                   array_1d_int,
-                                                                   array_1d_int,
-                                                                   ctypes.c_int]
-        self.ASLib.EXTERNAL_AmplInterface_struct_jac_g.restype = None
-
-        # structure hessian of Lagrangian
-        self.ASLib.EXTERNAL_AmplInterface_struct_hes_lag.argtypes = [ctypes.c_void_p,
-                                                                     array_1d_int,
-                                                                     array_1d_int,
-                                                                     ctypes.c_int]
-        self.ASLib.EXTERNAL_AmplInterface_struct_hes_lag.restype = None
-
-        # evaluate constraints
-        self.ASLib.EXTERNAL_AmplInterface_eval_g.argtypes = [ctypes.c_void_p,
-                                                             array_1d_double,
-                                                             ctypes.c_int,
-                                                             array_1d_double,
-                                                             ctypes.c_int]
-        self.ASLib.EXTERNAL_AmplInterface_eval_g.restype = ctypes.c_bool
-
-        # evaluate jacobian constraints
-        self.ASLib.EXTERNAL_AmplInterface_eval_jac_g.argtypes = [ctypes.c_void_p,
-                                                                 array_1d_double,
-                                                                 ctypes.c_int,
-                                                                 array_1d_double,
-                                                                 ctypes.c_int]
-        self.ASLib.EXTERNAL_AmplInterface_eval_jac_g.restype = ctypes.c_bool
-
-        # temporary try/except block while changes get merged in pynumero_libraries
-        try:
-            self.ASLib.EXTERNAL_AmplInterface_dummy.argtypes = [ctypes.c_void_p]
-            self.ASLib.EXTERNAL_AmplInterface_dummy.restype = None
-            # evaluate hessian Lagrangian
-            self.ASLib.EXTERNAL_AmplInterface_eval_hes_lag.argtypes = [ctypes.c_void_p,
-                                                                       array_1d_double,
-                                                                       ctypes.c_int,
-                                                                       array_1d_double,
-                                                                       ctypes.c_int,
-                                                                       array_1d_double,
-                                                                       ctypes.c_int,
-                                                                       ctypes.c_double]
-            self.ASLib.EXTERNAL_AmplInterface_eval_hes_lag.restype = ctypes.c_bool
-            self.future_libraries = True
-        except Exception:
-            # evaluate hessian Lagrangian
-            self.ASLib.EXTERNAL_AmplInterface_eval_hes_lag.argtypes = [ctypes.c_void_p,
-                                                                       array_1d_double,
-                                                                       ctypes.c_int,
-                                                                       array_1d_double,
-                                                                       ctypes.c_int,
-                                                                       array_1d_double,
-                                                                       ctypes.c_int]
-            self.ASLib.EXTERNAL_AmplInterface_eval_hes_lag.restype = ctypes.c_bool
-            self.future_libraries = False
-
-        # finalize solution
-        self.ASLib.EXTERNAL_AmplInterface_finalize_solution.argtypes = [ctypes.c_void_p,
-                                                                        ctypes.c_int,
-                                                                        ctypes.c_char_p,
-                                                                        array_1d_double,
-                                                                        ctypes.c_int,
-                                                                        array_1d_double,
-                                                                        ctypes.c_int]
-        self.ASLib.EXTERNAL_AmplInterface_finalize_solution.restype = None
-
-        # destructor
-        self.ASLib.EXTERNAL_AmplInterface_free_memory.argtypes = [ctypes.c_void_p]
-        self.ASLib.EXTERNAL_AmplInterface_free_memory.restype = None
+        self.ASLib = _load_asl()
+        self.future_libraries = _ASL_FUTURE_LIBRARIES
+        self._batched_init = hasattr(self.ASLib, 'EXTERNAL_AmplInterface_get_all_init')
+        self._batched_structure = hasattr(self.ASLib, 'EXTERNAL_AmplInterface_get_all_structure')
+        self._batched_eval_g = hasattr(self.ASLib, 'EXTERNAL_AmplInterface_eval_g_batch')
+        self._structure_loaded = False
 
         if filename is not None:
-            if nl_buffer is not None:
-                raise ValueError("Cannot specify both filename= and nl_buffer=")
-
-            b_data = filename.encode('utf-8')
+            b_data = _as_bytes(filename)
             self._obj = self.ASLib.EXTERNAL_AmplInterface_new_file(b_data)
-        elif nl_buffer is not None:
-            b_data = nl_buffer.encode('utf-8')
-            if os.name in ['nt', 'dos']:
-                self._obj = self.ASLib.EXTERNAL_AmplInterface_new_file(b_data)
-            else:
-                self._obj = self.ASLib.EXTERNAL_AmplInterface_new_str(b_data)
 
         assert self._obj, "Error building ASL interface. Possible error in nl-file"
+        # keep the handle as a c_void_p so ctypes does not rebuild it on
+        # every call
+        self._obj_p = ctypes.c_void_p(self._obj)
 
         self._nx = self.get_n_vars()
         self._ny = self.get_n_constraints()
         self._nnz_jac_g = self.get_nnz_jac_g()
         self._nnz_hess = self.get_nnz_hessian_lag()
 
+        # output buffer for eval_f (reused across calls)
+        self._sol_buf = ctypes.c_double(0.0)
+        self._sol_ref = ctypes.byref(self._sol_buf)
+
+        # cache the foreign functions used in the evaluation callbacks
+        self._c_eval_f = self.ASLib.EXTERNAL_AmplInterface_eval_f
+        self._c_eval_deriv_f = self.ASLib.EXTERNAL_AmplInterface_eval_deriv_f
+        self._c_eval_g = self.ASLib.EXTERNAL_AmplInterface_eval_g
+        self._c_eval_jac_g = self.ASLib.EXTERNAL_AmplInterface_eval_jac_g
+        self._c_eval_hes_lag = self.ASLib.EXTERNAL_AmplInterface_eval_hes_lag
+
     def __del__(self):
-        self.ASLib.EXTERNAL_AmplInterface_free_memory(self._obj)
+        self.ASLib.EXTERNAL_AmplInterface_free_memory(self._obj_p)
 
     def get_n_vars(self):
-        return self.ASLib.EXTERNAL_AmplInterface_n_vars(self._obj)
+        return self.ASLib.EXTERNAL_AmplInterface_n_vars(self._obj_p)
 
     def get_n_constraints(self):
-        return self.ASLib.EXTERNAL_AmplInterface_n_constraints(self._obj)
+        return self.ASLib.EXTERNAL_AmplInterface_n_constraints(self._obj_p)
 
     def get_nnz_jac_g(self):
-        return self.ASLib.EXTERNAL_AmplInterface_nnz_jac_g(self._obj)
+        return self.ASLib.EXTERNAL_AmplInterface_nnz_jac_g(self._obj_p)
 
     def get_nnz_hessian_lag(self):
-        return self.ASLib.EXTERNAL_AmplInterface_nnz_hessian_lag(self._obj)
+        return self.ASLib.EXTERNAL_AmplInterface_nnz_hessian_lag(self._obj_p)
 
     def get_bounds_info(self, xl, xu, gl, gu):
         x_l = xl.astype(np.double, casting='safe', copy=False)
         x_u = xu.astype(np.double, casting='safe', copy=False)
         g_l = gl.astype(np.double, casting='safe', copy=False)
         g_u = gu.astype(np.double, casting='safe', copy=False)
-        nx = len(x_l)
-        ng = len(g_l)
-        assert nx == len(x_u), "lower and upper bound x vectors must be the same size"
-        assert ng == len(g_u), "lower and upper bound g vectors must be the same size"
-        self.ASLib.EXTERNAL_AmplInterface_get_bounds_info(self._obj,
+        nx = x_l.shape[0]
+        ng = g_l.shape[0]
+        assert nx == x_u.shape[0], "lower and upper bound x vectors must be the same size"
+        assert ng == g_u.shape[0], "lower and upper bound g vectors must be the same size"
+        self.ASLib.EXTERNAL_AmplInterface_get_bounds_info(self._obj_p,
                                                           x_l,
                                                           x_u,
                                                           nx,
@@ -242,117 +343,240 @@ class AmplInterface(object):
                                                           ng)
 
     def get_x_lower_bounds(self, invec):
-        self.ASLib.EXTERNAL_AmplInterface_x_lower_bounds(self._obj, invec, len(invec))
+        if __debug__:
+            _check_double(invec, self._nx, 'get_x_lower_bounds')
+        self.ASLib.EXTERNAL_AmplInterface_x_lower_bounds(self._obj_p, invec, invec.shape[0])
 
     def get_x_upper_bounds(self, invec):
-        self.ASLib.EXTERNAL_AmplInterface_x_upper_bounds(self._obj, invec, len(invec))
+        if __debug__:
+            _check_double(invec, self._nx, 'get_x_upper_bounds')
+        self.ASLib.EXTERNAL_AmplInterface_x_upper_bounds(self._obj_p, invec, invec.shape[0])
 
     def get_g_lower_bounds(self, invec):
-        self.ASLib.EXTERNAL_AmplInterface_g_lower_bounds(self._obj, invec, len(invec))
+        if __debug__:
+            _check_double(invec, self._ny, 'get_g_lower_bounds')
+        self.ASLib.EXTERNAL_AmplInterface_g_lower_bounds(self._obj_p, invec, invec.shape[0])
 
     def get_g_upper_bounds(self, invec):
-        self.ASLib.EXTERNAL_AmplInterface_g_upper_bounds(self._obj, invec, len(invec))
+        if __debug__:
+            _check_double(invec, self._ny, 'get_g_upper_bounds')
+        self.ASLib.EXTERNAL_AmplInterface_g_upper_bounds(self._obj_p, invec, invec.shape[0])
 
     def get_init_x(self, invec):
-        self.ASLib.EXTERNAL_AmplInterface_get_init_x(self._obj, invec, len(invec))
+        if __debug__:
+            _check_double(invec, self._nx, 'get_init_x')
+        self.ASLib.EXTERNAL_AmplInterface_get_init_x(self._obj_p, invec, invec.shape[0])
 
     def get_init_multipliers(self, invec):
-        self.ASLib.EXTERNAL_AmplInterface_get_init_multipliers(self._obj, invec, len(invec))
+        if __debug__:
+            _check_double(invec, self._ny, 'get_init_multipliers')
+        self.ASLib.EXTERNAL_AmplInterface_get_init_multipliers(self._obj_p, invec, invec.shape[0])
+
+    def get_all_init(self, xl, xu, gl, gu, init_x, init_lam):
+        """
+        Fills the bounds on x and g and the initial values of x and
+        the multipliers with a single call to ASL
+        """
+        if __debug__:
+            for invec in (xl, xu, init_x):
+                _check_double(invec, self._nx, 'get_all_init')
+            for invec in (gl, gu, init_lam):
+                _check_double(invec, self._ny, 'get_all_init')
+        # The batched call bounds every copy by a single nx and ny, so it
+        # is only used when all the buffers have those sizes. The
+        # per-field getters bound each copy by the buffer's own length
+        if self._batched_init \
+                and xl.shape[0] == xu.shape[0] == init_x.shape[0] == self._nx \
+                and gl.shape[0] == gu.shape[0] == init_lam.shape[0] == self._ny:
+            self.ASLib.EXTERNAL_AmplInterface_get_all_init(self._obj_p,
+                                                           xl,
+                                                           xu,
+                                                           gl,
+                                                           gu,
+                                                           init_x,
+                                                           init_lam,
+                                                           self._nx,
+                                                           self._ny)
+        else:
+            self.get_x_lower_bounds(xl)
+            self.get_x_upper_bounds(xu)
+            self.get_g_lower_bounds(gl)
+            self.get_g_upper_bounds(gu)
+            self.get_init_x(init_x)
+            self.get_init_multipliers(init_lam)
 
     def eval_f(self, x):
-        assert x.size == self._nx, "Error: Dimension missmatch."
-        assert x.dtype == np.double, "Error: array type. Function eval_deriv_f expects an array of type double"
-        sol = ctypes.c_double()
-        res = self.ASLib.EXTERNAL_AmplInterface_eval_f(self._obj, x, self._nx, ctypes.byref(sol))
+        if __debug__:
+            _check_double(x, self._nx, 'eval_f')
+        res = self._c_eval_f(self._obj_p, x, self._nx, self._sol_ref)
         assert res, "Error in AMPL evaluation"
-        return sol.value
+        return self._sol_buf.value
 
     def eval_deriv_f(self, x, df):
-        assert x.size == self._nx, "Error: Dimension missmatch."
-        assert x.dtype == np.double, "Error: array type. Function eval_deriv_f expects an array of type double"
-        res = self.ASLib.EXTERNAL_AmplInterface_eval_deriv_f(self._obj, x, df, len(x))
+        if __debug__:
+            _check_double(x, self._nx, 'eval_deriv_f')
+            _check_double(df, self._nx, 'eval_deriv_f')
+        res = self._c_eval_deriv_f(self._obj_p, x, df, self._nx)
         assert res, "Error in AMPL evaluation"
 
-    def struct_jac_g(self, irow, jcol):
-        irow_p = irow.astype(np.intc, casting='safe', copy=False)
-        jcol_p = jcol.astype(np.intc, casting='safe', copy=False)
-        assert len(irow) == len(jcol), "Error: Dimension missmatch. Arrays irow and jcol must be of the same size"
-        assert len(irow) == self._nnz_jac_g, "Error: Dimension missmatch. Jacobian has {} nnz".format(self._nnz_jac_g)
-        self.ASLib.EXTERNAL_AmplInterface_struct_jac_g(self._obj,
-                                                       irow_p,
-                                                       jcol_p,
-                                                       len(irow))
+    def _load_structure(self):
+        """
+        Queries ASL for the structure of the jacobian of the
+        constraints and of the hessian of the Lagrangian. The structure
+        does not change, so it is stored on the object and reused
+        """
+        self._jac_irow = np.zeros(self._nnz_jac_g, dtype=np.intc)
+        self._jac_jcol = np.zeros(self._nnz_jac_g, dtype=np.intc)
+        self._hes_irow = np.zeros(self._nnz_hess, dtype=np.intc)
+        self._hes_jcol = np.zeros(self._nnz_hess, dtype=np.intc)
+        if self._batched_structure:
+            self.ASLib.EXTERNAL_AmplInterface_get_all_structure(self._obj_p,
+                                                                self._jac_irow,
+                                                                self._jac_jcol,
+                                                                self._nnz_jac_g,
+                                                                self._hes_irow,
+                                                                self._hes_jcol,
+                                                                self._nnz_hess)
+        else:
+            self.ASLib.EXTERNAL_AmplInterface_struct_jac_g(self._obj_p,
+                                                           self._jac_irow,
+                                                           self._jac_jcol,
+                                                           self._nnz_jac_g)
+            self.ASLib.EXTERNAL_AmplInterface_struct_hes_lag(self._obj_p,
+                                                             self._hes_irow,
+                                                             self._hes_jcol,
+                                                             self._nnz_hess)
+        for a in (self._jac_irow, self._jac_jcol, self._hes_irow, self._hes_jcol):
+            a.flags.writeable = False
+        self._structure_loaded = True
 
+    def struct_jac_g(self, irow, jcol):
+        assert irow.shape[0] == jcol.shape[0], "Error: Dimension missmatch. Arrays irow and jcol must be of the same size"
+        assert irow.shape[0] == self._nnz_jac_g, "Error: Dimension missmatch. Jacobian has {} nnz".format(self._nnz_jac_g)
+        if not self._structure_loaded:
+            self._load_structure()
+        np.copyto(irow, self._jac_irow, casting='safe')
+        np.copyto(jcol, self._jac_jcol, casting='safe')
 
     def struct_hes_lag(self, irow, jcol):
-        irow_p = irow.astype(np.intc, casting='safe', copy=False)
-        jcol_p = jcol.astype(np.intc, casting='safe', copy=False)
-        assert len(irow) == len(jcol), "Error: Dimension missmatch. Arrays irow and jcol must be of the same size"
-        assert len(irow) == self._nnz_hess, "Error: Dimension missmatch. Hessian has {} nnz".format(self._nnz_hess)
-        self.ASLib.EXTERNAL_AmplInterface_struct_hes_lag(self._obj,
-                                                         irow_p,
-                                                         jcol_p,
-                                                         len(irow))
+        assert irow.shape[0] == jcol.shape[0], "Error: Dimension missmatch. Arrays irow and jcol must be of the same size"
+        assert irow.shape[0] == self._nnz_hess, "Error: Dimension missmatch. Hessian has {} nnz".format(self._nnz_hess)
+        if not self._structure_loaded:
+            self._load_structure()
+        np.copyto(irow, self._hes_irow, casting='safe')
+        np.copyto(jcol, self._hes_jcol, casting='safe')
+
+    def get_all_structure(self, irow_jac, jcol_jac, irow_hes, jcol_hes):
+        """
+        Fills the structure of the jacobian of the constraints and of
+        the hessian of the Lagrangian (a single call to ASL at most)
+        """
+        self.struct_jac_g(irow_jac, jcol_jac)
+        self.struct_hes_lag(irow_hes, jcol_hes)
 
     def eval_jac_g(self, x, jac_g_values):
-        assert x.size == self._nx, "Error: Dimension missmatch."
-        assert jac_g_values.size == self._nnz_jac_g, "Error: Dimension missmatch."
-        xeval = x.astype(np.double, casting='safe', copy=False)
-        jac_eval = jac_g_values.astype(np.double, casting='safe', copy=False)
-        res = self.ASLib.EXTERNAL_AmplInterface_eval_jac_g(self._obj,
-                                                           xeval,
-                                                           self._nx,
-                                                           jac_eval,
-                                                           self._nnz_jac_g)
+        if __debug__:
+            _check_double(x, self._nx, 'eval_jac_g')
+            _check_double(jac_g_values, self._nnz_jac_g, 'eval_jac_g')
+        res = self._c_eval_jac_g(self._obj_p,
+                                 x,
+                                 self._nx,
+                                 jac_g_values,
+                                 self._nnz_jac_g)
         assert res, "Error in AMPL evaluation"
 
     def eval_g(self, x, g):
-        assert x.size == self._nx, "Error: Dimension missmatch."
-        assert g.size == self._ny, "Error: Dimension missmatch."
-        assert x.dtype == np.double, "Error: array type. Function eval_g expects an array of type double"
-        assert g.dtype == np.double, "Error: array type. Function eval_g expects an array of type double"
-        res = self.ASLib.EXTERNAL_AmplInterface_eval_g(self._obj,
-                                                       x,
-                                                       self._nx,
-                                                       g,
-                                                       self._ny)
+        if __debug__:
+            _check_double(x, self._nx, 'eval_g')
+            _check_double(g, self._ny, 'eval_g')
+        res = self._c_eval_g(self._obj_p,
+                             x,
+                             self._nx,
+                             g,
+                             self._ny)
+        assert res, "Error in AMPL evaluation"
+
+    def eval_g_batch(self, X, G):
+        """
+        Evaluates the constraints at each row of X (k x nx) and stores
+        the results in the rows of G (k x ng)
+        """
+        assert X.ndim == 2 and X.shape[1] == self._nx, \
+            "Error: Dimension missmatch. X must have {} columns".format(self._nx)
+        assert G.shape == (X.shape[0], self._ny), \
+            "Error: Dimension missmatch. G must have shape ({}, {})".format(X.shape[0], self._ny)
+        if __debug__:
+            _check_double(X, X.shape[0] * self._nx, 'eval_g_batch')
+            _check_double(G, X.shape[0] * self._ny, 'eval_g_batch')
+        if not self._batched_eval_g:
+            for i in range(X.shape[0]):
+                self.eval_g(X[i], G[i])
+            return
+        res = self.ASLib.EXTERNAL_AmplInterface_eval_g_batch(self._obj_p,
+                                                             X,
+                                                             X.shape[0],
+                                                             self._nx,
+                                                             G,
+                                                             self._ny)
         assert res, "Error in AMPL evaluation"
 
     def eval_hes_lag(self, x, lam, hes_lag, obj_factor=1.0):
-        assert x.size == self._nx, "Error: Dimension missmatch."
-        assert lam.size == self._ny, "Error: Dimension missmatch."
-        assert hes_lag.size == self._nnz_hess, "Error: Dimension missmatch."
-        assert x.dtype == np.double, "Error: array type. Function eval_hes_lag expects an array of type double"
-        assert lam.dtype == np.double, "Error: array type. Function eval_hes_lag expects an array of type double"
-        assert hes_lag.dtype == np.double, "Error: array type. Function eval_hes_lag expects an array of type double"
+        if __debug__:
+            _check_double(x, self._nx, 'eval_hes_lag')
+            _check_double(lam, self._ny, 'eval_hes_lag')
+            _check_double(hes_lag, self._nnz_hess, 'eval_hes_lag')
         if self.future_libraries:
-            res = self.ASLib.EXTERNAL_AmplInterface_eval_hes_lag(self._obj,
-                                                                 x,
-                                                                 self._nx,
-                                                                 lam,
-                                                                 self._ny,
-                                                                 hes_lag,
-                                                                 self._nnz_hess,
-                                                                 obj_factor)
+            res = self._c_eval_hes_lag(self._obj_p,
+                                       x,
+                                       self._nx,
+                                       lam,
+                                       self._ny,
+                                       hes_lag,
+                                       self._nnz_hess,
+                                       obj_factor)
         else:
-            res = self.ASLib.EXTERNAL_AmplInterface_eval_hes_lag(self._obj,
-                                                                 x,
-                                                                 self._nx,
-                                                                 lam,
-                                                                 self._ny,
-                                                                 hes_lag,
-                                                                 self._nnz_hess)
+            res = self._c_eval_hes_lag(self._obj_p,
+                                       x,
+                                       self._nx,
+                                       lam,
+                                       self._ny,
+                                       hes_lag,
+                                       self._nnz_hess)
         assert res, "Error in AMPL evaluation"
 
+    # Unchecked versions of the evaluation methods for callers that own
+    # correctly sized double arrays (e.g. AmplNLP). No checks are done on
+    # the arguments; the status returned by ASL is passed back instead of
+    # being asserted.
+    def _eval_f_raw(self, x):
+        res = self._c_eval_f(self._obj_p, x, self._nx, self._sol_ref)
+        return res, self._sol_buf.value
+
+    def _eval_deriv_f_raw(self, x, df):
+        return self._c_eval_deriv_f(self._obj_p, x, df, self._nx)
+
+    def _eval_g_raw(self, x, g):
+        return self._c_eval_g(self._obj_p, x, self._nx, g, self._ny)
+
+    def _eval_jac_g_raw(self, x, jac_g_values):
+        return self._c_eval_jac_g(self._obj_p, x, self._nx, jac_g_values, self._nnz_jac_g)
+
+    def _eval_hes_lag_raw(self, x, lam, hes_lag, obj_factor=1.0):
+        if self.future_libraries:
+            return self._c_eval_hes_lag(self._obj_p, x, self._nx, lam, self._ny,
+                                        hes_lag, self._nnz_hess, obj_factor)
+        return self._c_eval_hes_lag(self._obj_p, x, self._nx, lam, self._ny,
+                                    hes_lag, self._nnz_hess)
+
     def finalize_solution(self, ampl_solve_status_num, msg, x, lam):
+        if __debug__:
+            _check_double(x, self._nx, 'finalize_solution')
+            _check_double(lam, self._ny, 'finalize_solution')
         b_msg = msg.encode('utf-8')
-        self.ASLib.EXTERNAL_AmplInterface_finalize_solution(self._obj,
+        self.ASLib.EXTERNAL_AmplInterface_finalize_solution(self._obj_p,
                                                             ampl_solve_status_num,
                                                             b_msg,
                                                             x,
-                                                            len(x),
+                                                            x.shape[0],
                                                             lam,
-                                                            len(lam))
-
-
-
+                                                            lam.shape[0])
@@ -105,28 +105,26 @@ class AslNLP(ExtendedNLP):
         self._nnz_jac_full = self._asl.get_nnz_jac_g()
         self._nnz_hess_lag_lower = self._asl.get_nnz_hessian_lag()
 
-        # get the initial values for the primals 
+        # get the initial values for the primals and the duals, the
+        # bounds on the primal variables and the bounds on the
+        # constraints (equality and inequality are mixed in the ampl
+        # solver library)
         self._init_primals = np.zeros(self._n_primals, dtype=np.float64)
         self._init_duals_full = np.zeros(self._n_con_full, dtype=np.float64)
-        self._asl.get_init_x(self._init_primals)
-        self._asl.get_init_multipliers(self._init_duals_full)
-        self._init_primals.flags.writeable = False
-        self._init_duals_full.flags.writeable = False
-
-        # get the bounds on the primal variables
         self._primals_lb = np.zeros(self._n_primals, dtype=np.float64)
         self._primals_ub = np.zeros(self._n_primals, dtype=np.float64)
-        self._asl.get_x_lower_bounds(self._primals_lb)
-        self._asl.get_x_upper_bounds(self._primals_ub)
-        self._primals_lb.flags.writeable = False
-        self._primals_ub.flags.writeable = False
-
-        # get the bounds on the constraints (equality and
-        # inequality are mixed in the ampl solver library)
         self._con_full_lb = np.zeros(self._n_con_full, dtype=np.float64)
         self._con_full_ub = np.zeros(self._n_con_full, dtype=np.float64)
-        self._asl.get_g_lower_bounds(self._con_full_lb)
-        self._asl.get_g_upper_bounds(self._con_full_ub)
+        self._asl.get_all_init(self._primals_lb,
+                               self._primals_ub,
+                               self._con_full_lb,
+                               self._con_full_ub,
+                               self._init_primals,
+                               self._init_duals_full)
+        self._init_primals.flags.writeable = False
+        self._init_duals_full.flags.writeable = False
+        self._primals_lb.flags.writeable = False
+        self._primals_ub.flags.writeable = False
 
         # check to make sure there are no fixed variables or crossed bounds
         # TODO: this tolerance should somehow be linked to the algorithm tolerance?
@@ -177,10 +175,15 @@ class AslNLP(ExtendedNLP):
         self._n_con_eq = len(self._con_eq_full_map)
         self._n_con_ineq = len(self._con_ineq_full_map)
 
-        # populate jacobian structure
+        # populate jacobian and hessian structure
         self._irows_jac_full = np.zeros(self._nnz_jac_full, dtype=np.intc)
         self._jcols_jac_full = np.zeros(self._nnz_jac_full, dtype=np.intc)
-        self._asl.struct_jac_g(self._irows_jac_full, self._jcols_jac_full)
+        self._irows_hess = np.zeros(self._nnz_hess_lag_lower, dtype=np.intc)
+        self._jcols_hess = np.zeros(self._nnz_hess_lag_lower, dtype=np.intc)
+        self._asl.get_all_structure(self._irows_jac_full,
+                                    self._jcols_jac_full,
+                                    self._irows_hess,
+                                    self._jcols_hess)
         self._irows_jac_full -= 1
         self._jcols_jac_full -= 1
         self._irows_jac_full.flags.writeable = False
@@ -213,10 +216,7 @@ class AslNLP(ExtendedNLP):
         self._nnz_jac_eq = len(self._jcols_jac_eq)
         self._nnz_jac_ineq = len(self._jcols_jac_ineq)
 
-        # populate hessian structure (lower triangular)
-        self._irows_hess = np.zeros(self._nnz_hess_lag_lower, dtype=np.intc)
-        self._jcols_hess = np.zeros(self._nnz_hess_lag_lower, dtype=np.intc)
-        self._asl.struct_hes_lag(self._irows_hess, self._jcols_hess)
+        # hessian structure (lower triangular)
         self._irows_hess -= 1
         self._jcols_hess -= 1
 
@@ -426,7 +426,8 @@ class AslNLP(ExtendedNLP):
 
     def _evaluate_objective_and_cache_if_necessary(self):
         if not self._objective_is_cached:
-            self._cached_objective = self._asl.eval_f(self._primals)
+            res, self._cached_objective = self._asl._eval_f_raw(self._primals)
+            assert res, "Error in AMPL evaluation"
             self._objective_is_cached = True
 
     # overloaded from NLP
@@ -437,7 +438,8 @@ class AslNLP(ExtendedNLP):
     # overloaded from NLP
     def evaluate_grad_objective(self, out=None):
         if not self._grad_objective_is_cached:
-            self._asl.eval_deriv_f(self._primals, self._cached_grad_objective)
+            res = self._asl._eval_deriv_f_raw(self._primals, self._cached_grad_objective)
+            assert res, "Error in AMPL evaluation"
             self._grad_objective_is_cached = True
 
         if out is not None:
@@ -452,7 +454,8 @@ class AslNLP(ExtendedNLP):
         # ASL computes the full constraint vector, therefore, we merge
         # this computation into one
         if not self._con_full_is_cached:
-            self._asl.eval_g(self._primals, self._cached_con_full)
+            res = self._asl._eval_g_raw(self._primals, self._cached_con_full)
+            assert res, "Error in AMPL evaluation"
             self._cached_con_full -= self._con_full_rhs
             self._con_full_is_cached = True
 
@@ -502,7 +505,8 @@ class AslNLP(ExtendedNLP):
         # ASL computes the jacobian for the full constraints, therefore, we merge
         # this computation into one
         if not self._jac_full_is_cached:
-            self._asl.eval_jac_g(self._primals, self._cached_jac_full.data)
+            res = self._asl._eval_jac_g_raw(self._primals, self._cached_jac_full.data)
+            assert res, "Error in AMPL evaluation"
 
     # overloaded from NLP
     def evaluate_jacobian(self, out=None):
@@ -571,8 +575,9 @@ class AslNLP(ExtendedNLP):
 
             # get the hessian
             data = np.zeros(self._nnz_hess_lag_lower, np.float64)
-            self._asl.eval_hes_lag(self._primals, self._duals_full,
-                                   data, obj_factor=self._obj_factor)
+            res = self._asl._eval_hes_lag_raw(self._primals, self._duals_full,
+                                              data, obj_factor=self._obj_factor)
+            assert res, "Error in AMPL evaluation"
             values = np.concatenate((data, data[self._lower_hess_mask]))
             #TODO: find out why this is done
             values += 1e-16 # this is to deal with scipy bug temporarily
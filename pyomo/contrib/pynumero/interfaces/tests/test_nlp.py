@@ -363,6 +363,78 @@ class TestAslNLP(unittest.TestCase):
         anlp = AslNLP(self.filename)
         execute_extended_nlp_interface(self, anlp)
         
+@unittest.skipIf(os.name in ['nt', 'dos'], "Do not test on windows")
+class TestAmplInterface(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.pm = create_pyomo_model1()
+        temporary_dir = tempfile.mkdtemp()
+        cls.filename = os.path.join(temporary_dir, "Pyomo_TestAmplInterface")
+        cls.pm.write(cls.filename+'.nl', io_options={"symbolic_solver_labels": True})
+
+    def test_eval_g_batch(self):
+        asl = AmplInterface(self.filename)
+        nx = asl.get_n_vars()
+        ng = asl.get_n_constraints()
+        X = np.vstack([np.ones(nx), np.arange(nx, dtype=np.double), -np.ones(nx)])
+        G = np.zeros((X.shape[0], ng))
+        asl.eval_g_batch(X, G)
+        g = np.zeros(ng)
+        for i in range(X.shape[0]):
+            asl.eval_g(X[i], g)
+            self.assertTrue(np.array_equal(G[i], g))
+
+        with self.assertRaises(AssertionError):
+            asl.eval_g_batch(X.astype(np.float32), G)
+        with self.assertRaises(AssertionError):
+            asl.eval_g_batch(X, np.zeros((X.shape[0], ng+1)))
+
+    def test_get_all_init(self):
+        asl = AmplInterface(self.filename)
+        nx = asl.get_n_vars()
+        ng = asl.get_n_constraints()
+        xl, xu, init_x = np.zeros(nx), np.zeros(nx), np.zeros(nx)
+        gl, gu, init_lam = np.zeros(ng), np.zeros(ng), np.zeros(ng)
+        asl.get_all_init(xl, xu, gl, gu, init_x, init_lam)
+
+        expected = np.zeros(nx)
+        asl.get_x_lower_bounds(expected)
+        self.assertTrue(np.array_equal(xl, expected))
+        asl.get_x_upper_bounds(expected)
+        self.assertTrue(np.array_equal(xu, expected))
+        asl.get_init_x(expected)
+        self.assertTrue(np.array_equal(init_x, expected))
+        expected = np.zeros(ng)
+        asl.get_g_lower_bounds(expected)
+        self.assertTrue(np.array_equal(gl, expected))
+        asl.get_g_upper_bounds(expected)
+        self.assertTrue(np.array_equal(gu, expected))
+        asl.get_init_multipliers(expected)
+        self.assertTrue(np.array_equal(init_lam, expected))
+
+    def test_get_all_structure(self):
+        asl = AmplInterface(self.filename)
+        nnz_jac = asl.get_nnz_jac_g()
+        nnz_hes = asl.get_nnz_hessian_lag()
+        irow_jac = np.zeros(nnz_jac, dtype=np.intc)
+        jcol_jac = np.zeros(nnz_jac, dtype=np.intc)
+        irow_hes = np.zeros(nnz_hes, dtype=np.intc)
+        jcol_hes = np.zeros(nnz_hes, dtype=np.intc)
+        asl.get_all_structure(irow_jac, jcol_jac, irow_hes, jcol_hes)
+
+        # struct_jac_g/struct_hes_lag share the cached structure, so the
+        # reference is queried from the per-field library calls
+        irow = np.zeros(nnz_jac, dtype=np.intc)
+        jcol = np.zeros(nnz_jac, dtype=np.intc)
+        asl.ASLib.EXTERNAL_AmplInterface_struct_jac_g(asl._obj_p, irow, jcol, nnz_jac)
+        self.assertTrue(np.array_equal(irow_jac, irow))
+        self.assertTrue(np.array_equal(jcol_jac, jcol))
+        irow = np.zeros(nnz_hes, dtype=np.intc)
+        jcol = np.zeros(nnz_hes, dtype=np.intc)
+        asl.ASLib.EXTERNAL_AmplInterface_struct_hes_lag(asl._obj_p, irow, jcol, nnz_hes)
+        self.assertTrue(np.array_equal(irow_hes, irow))
+        self.assertTrue(np.array_equal(jcol_hes, jcol))
+
 @unittest.skipIf(os.name in ['nt', 'dos'], "Do not test on windows")
 class TestAmplNLP(unittest.TestCase):
     @classmethod
@@ -16,11 +16,20 @@ __all__ = ['norm']
 def norm(x, ord=None):
 
     f = np.linalg.norm
-    if isinstance(x, np.ndarray):
-        return f(x, ord=ord)
-    elif isinstance(x, BlockVector):
+    if isinstance(x, BlockVector):
+        assert not x.has_none, 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
+        # accumulate block by block to avoid flattening the vector
+        if ord is None or ord == 2:
+            return np.sqrt(sum(norm(blk) ** 2 for blk in x))
+        elif ord == np.inf:
+            # empty blocks do not contribute to the max
+            return max([norm(blk, ord=ord) for blk in x if blk.size > 0] or [0.0])
+        elif ord == 1:
+            return sum(norm(blk, ord=ord) for blk in x)
         flat_x = x.flatten()
         return f(flat_x, ord=ord)
+    elif isinstance(x, np.ndarray):
+        return f(x, ord=ord)
     else:
         raise NotImplementedError()
 
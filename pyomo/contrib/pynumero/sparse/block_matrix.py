@@ -27,6 +27,7 @@ from scipy.sparse import coo_matrix
 from scipy.sparse import isspmatrix
 from pyomo.contrib.pynumero.sparse.utils import is_symmetric_sparse
 import numpy as np
+import operator
 
 __all__ = ['BlockMatrix', 'BlockSymMatrix']
 
@@ -224,8 +225,9 @@ class BlockMatrix(object):
 
         data = np.empty(nonzeros, dtype=dtype)
         idx_dtype = get_index_dtype(maxval=max(shape))
-        row = -np.ones(nonzeros, dtype=idx_dtype)
-        col = -np.ones(nonzeros, dtype=idx_dtype)
+        # every entry is written below, so no need to initialize
+        row = np.empty(nonzeros, dtype=idx_dtype)
+        col = np.empty(nonzeros, dtype=idx_dtype)
 
         nnz = 0
         ii, jj = np.nonzero(self._block_mask)
@@ -233,10 +235,9 @@ class BlockMatrix(object):
             B = self[i, j].tocoo()
             idx = slice(nnz, nnz + B.nnz)
             data[idx] = B.data
-            #row[idx] = (B.row + row_offsets[i]).astype(idx_dtype, copy=False)
-            #col[idx] = (B.col + col_offsets[j]).astype(idx_dtype, copy=False)
-            row[idx] = B.row + row_offsets[i]
-            col[idx] = B.col + col_offsets[j]
+            # shift indices directly into the output (no temporaries)
+            np.add(B.row, row_offsets[i], out=row[idx], casting='unsafe')
+            np.add(B.col, col_offsets[j], out=col[idx], casting='unsafe')
             nnz += B.nnz
 
         return coo_matrix((data, (row, col)), shape=shape)
@@ -289,6 +290,14 @@ class BlockMatrix(object):
         """
         return np.asmatrix(self.toarray())
 
+    def _zeros_result(self):
+        """
+        Returns a block vector of zeros with one block per block-row.
+        The blocks are views of a single buffer
+        """
+        row_offsets = np.append(0, np.cumsum(self._brow_lengths))
+        return BlockVector.from_flat(np.zeros(row_offsets[-1]), row_offsets)
+
     def _mul_sparse_matrix(self, other):
 
         assert other.shape == self.shape, "Dimension mismatch"
@@ -328,6 +337,24 @@ class BlockMatrix(object):
                     mat[j, i] = self[i, j].transpose()
         return mat
 
+    def copy(self):
+        """
+        Returns a copy of the block matrix. Blocks are copied as well
+
+        Returns
+        -------
+        BlockMatrix
+
+        """
+        m, n = self.bshape
+        mat = BlockMatrix(m, n)
+        mat._name = self._name
+        mat._brow_lengths = np.copy(self._brow_lengths)
+        mat._bcol_lengths = np.copy(self._bcol_lengths)
+        for i, j in zip(*np.nonzero(self._block_mask)):
+            mat[i, j] = self[i, j].copy()
+        return mat
+
     def is_empty_block(self, idx, jdx):
         """
         Indicates if a block is empty
@@ -521,7 +548,13 @@ class BlockMatrix(object):
             for i in range(m):
                 for j in range(n):
                     if not self.is_empty_block(i, j) and not other.is_empty_block(i, j):
-                        result[i, j] = self._blocks[i, j] + other[i, j]
+                        if other[i, j].nnz == 0:
+                            # adding an empty block is a no-op
+                            assert other[i, j].shape == self._blocks[i, j].shape, \
+                                'dimensions mismatch in block ({}, {})'.format(i, j)
+                            result[i, j] = self._blocks[i, j].copy()
+                        else:
+                            result[i, j] = self._blocks[i, j] + other[i, j]
                     elif not self.is_empty_block(i, j) and other.is_empty_block(i, j):
                         result[i, j] = self._blocks[i, j]
                     elif self.is_empty_block(i, j) and not other.is_empty_block(i, j):
@@ -553,7 +586,12 @@ class BlockMatrix(object):
             for i in range(m):
                 for j in range(n):
                     if self._block_mask[i, j] and other._block_mask[i, j]:
-                        result[i, j] = self._blocks[i, j] - other[i, j]
+                        if other[i, j].nnz == 0:
+                            assert other[i, j].shape == self._blocks[i, j].shape, \
+                                'dimensions mismatch in block ({}, {})'.format(i, j)
+                            result[i, j] = self._blocks[i, j].copy()
+                        else:
+                            result[i, j] = self._blocks[i, j] - other[i, j]
                     elif self._block_mask[i, j] and not other._block_mask[i, j]:
                         result[i, j] = self._blocks[i, j]
                     elif not self._block_mask[i, j] and other._block_mask[i, j]:
@@ -610,31 +648,25 @@ class BlockMatrix(object):
             assert bn == other.bshape[0], 'Dimension mismatch'
             assert self.shape[1] == other.shape[0], 'Dimension mismatch'
             other._check_mask()
-            nblocks = self.bshape[0]
-            result = BlockVector(nblocks)
-            for i in range(bm):
-                result[i] = np.zeros(self._brow_lengths[i])
-                for j in range(bn):
-                    x = other[j]  # this flattens block vectors that are within block vectors
-                    if not self.is_empty_block(i, j):
-                        A = self._blocks[i, j]
-                        result[i] += A * x
+            result = self._zeros_result()
+            # the rows are views of the result so they are updated in place
+            rows = list(result)
+            ii, jj = np.nonzero(self._block_mask)
+            for i, j in zip(ii, jj):
+                x = other[j]  # this flattens block vectors that are within block vectors
+                rows[i] += self._blocks[i, j] * x
             return result
         elif isinstance(other, np.ndarray):
 
             assert self.shape[1] == other.shape[0], 'Dimension mismatch {}!={}'.format(self.shape[1],
                                                                                        other.shape[0])
-            nblocks = self.bshape[0]
-            result = BlockVector(nblocks)
-            for i in range(bm):
-                result[i] = np.zeros(self._brow_lengths[i])
-                counter = 0
-                for j in range(bn):
-                    if not self.is_empty_block(i, j):
-                        A = self._blocks[i, j]
-                        x = other[counter: counter + A.shape[1]]
-                        result[i] += A * x
-                        counter += A.shape[0]
+            col_offsets = np.append(0, np.cumsum(self._bcol_lengths))
+            result = self._zeros_result()
+            rows = list(result)
+            ii, jj = np.nonzero(self._block_mask)
+            for i, j in zip(ii, jj):
+                x = other[col_offsets[j]: col_offsets[j + 1]]
+                rows[i] += self._blocks[i, j] * x
             return result
         elif isinstance(other, BlockMatrix) or isspmatrix(other):
             return self._mul_sparse_matrix(other)
@@ -692,6 +724,92 @@ class BlockSymMatrix(BlockMatrix):
                     msg += '({}, {}): {}\n'.format(idx, jdx, repn)
         return msg
 
+    def _sym_binop(self, other, op, negate):
+        """
+        Applies op to the lower triangular blocks of two symmetric block
+        matrices. The result is symmetric so the upper blocks are set
+        to the transpose of the lower blocks without checking symmetry
+        """
+        self._check_mask()
+        other._check_mask()
+        assert other.bshape == self.bshape, \
+            'dimensions mismatch {} != {}'.format(self.bshape, other.bshape)
+        assert other.shape == self.shape, \
+            'dimensions mismatch {} != {}'.format(self.shape, other.shape)
+
+        n = self.bshape[0]
+        result = BlockSymMatrix(n)
+        for i in range(n):
+            for j in range(i + 1):
+                if self._block_mask[i, j] and other._block_mask[i, j] and other[i, j].nnz > 0:
+                    blk = op(self._blocks[i, j], other[i, j])
+                elif self._block_mask[i, j]:
+                    blk = self._blocks[i, j]
+                elif other._block_mask[i, j]:
+                    blk = -other[i, j] if negate else other[i, j]
+                else:
+                    continue
+                BlockMatrix.__setitem__(result, (i, j), blk)
+                if i != j:
+                    BlockMatrix.__setitem__(result, (j, i), blk.transpose())
+        return result
+
+    def __add__(self, other):
+        if isinstance(other, BlockSymMatrix):
+            return self._sym_binop(other, operator.add, False)
+        return super(BlockSymMatrix, self).__add__(other)
+
+    def __sub__(self, other):
+        if isinstance(other, BlockSymMatrix):
+            return self._sym_binop(other, operator.sub, True)
+        return super(BlockSymMatrix, self).__sub__(other)
+
+    def transpose(self, axes=None, copy=False):
+        """
+        Returns the transpose of the block matrix. Since the matrix is
+        symmetric this is the matrix itself unless a copy is requested.
+
+        Parameters
+        ----------
+        axes: None, optional
+            This argument is in the signature solely for NumPy compatibility reasons. Do not pass in
+            anything except for the default value.
+        copy: bool, optional
+            Indicates whether or not attributes of self should be copied whenever possible.
+
+        Returns
+        -------
+        BlockSymMatrix
+        """
+        if axes is not None:
+            raise ValueError(("Sparse matrices do not support "
+                              "an 'axes' parameter because swapping "
+                              "dimensions is the only logical permutation."))
+
+        if not copy:
+            return self
+        return self.copy()
+
+    def copy(self):
+        """
+        Returns a copy of the block matrix. Blocks are copied as well
+
+        Returns
+        -------
+        BlockSymMatrix
+
+        """
+        n = self.bshape[0]
+        mat = BlockSymMatrix(n)
+        mat._name = self._name
+        mat._brow_lengths = np.copy(self._brow_lengths)
+        mat._bcol_lengths = np.copy(self._bcol_lengths)
+        for i in range(n):
+            for j in range(i + 1):
+                if not self.is_empty_block(i, j):
+                    mat[i, j] = self[i, j].copy()
+        return mat
+
     def __getitem__(self, item):
 
         if isinstance(item, slice):
@@ -719,7 +837,9 @@ class BlockSymMatrix(BlockMatrix):
         if idx == jdx:
             assert is_symmetric_sparse(value), 'Matrix is not symmetric'
         super(BlockSymMatrix, self).__setitem__(key, value)
-        super(BlockSymMatrix, self).__setitem__((jdx, idx), value.transpose())
+        # diagonal blocks are symmetric so they are their own transpose
+        if idx != jdx:
+            super(BlockSymMatrix, self).__setitem__((jdx, idx), value.transpose())
 
 
 
@@ -20,8 +20,10 @@ where v_i are numpy arrays of dimension 1
 .. rubric:: Contents
 
 """
+from scipy.linalg import blas
 import numpy as np
-import copy as cp
+import functools
+import operator
 
 __all__ = ['BlockVector']
 
@@ -44,25 +46,32 @@ class BlockVector(np.ndarray):
         if isinstance(vectors, int):
             blocks = [None for i in range(vectors)]
             block_mask = np.zeros(vectors, dtype=bool)
-            brow_lengths = np.zeros(vectors, dtype=np.int64)
+            # block sizes are kept as python ints (cheaper than numpy scalars)
+            brow_lengths = [0] * vectors
             arr = np.asarray(blocks, dtype='object')
             obj = arr.view(cls)
-            obj._brow_lengths = np.array(brow_lengths, dtype=np.int64)
+            obj._brow_lengths = brow_lengths
             obj._block_mask = block_mask
             obj._nblocks = len(brow_lengths)
             obj._has_none = True
+            obj._size = 0
+            obj._nblocks_set = 0
+            obj._offsets = None
             return obj
         elif isinstance(vectors, list):
             nblocks = len(vectors)
             blocks = [None for i in range(nblocks)]
             block_mask = np.zeros(nblocks, dtype=bool)
-            brow_lengths = np.zeros(nblocks, dtype=np.int64)
+            brow_lengths = [0] * nblocks
             arr = np.asarray(blocks, dtype='object')
             obj = arr.view(cls)
-            obj._brow_lengths = np.array(brow_lengths, dtype=np.int64)
+            obj._brow_lengths = brow_lengths
             obj._block_mask = block_mask
             obj._nblocks = len(brow_lengths)
             obj._has_none = True
+            obj._size = 0
+            obj._nblocks_set = 0
+            obj._offsets = None
             for idx, blk in enumerate(vectors):
                 obj[idx] = blk
             return obj
@@ -76,6 +85,43 @@ class BlockVector(np.ndarray):
         self._brow_lengths = getattr(obj, '_brow_lengths', None)
         self._nblocks = getattr(obj, '_nblocks', 0)
         self._found_none = getattr(obj, '_has_none', True)
+        self._size = getattr(obj, '_size', 0)
+        self._nblocks_set = getattr(obj, '_nblocks_set', 0)
+        self._offsets = None
+
+    @classmethod
+    def from_flat(cls, data, offsets):
+        """
+        Returns a block vector whose blocks are views of a flat array
+
+        Parameters
+        ----------
+        data: ndarray
+            1d-array with the entries of all blocks
+        offsets: list or ndarray
+            position of the first entry of each block in data followed
+            by the size of data
+
+        Returns
+        -------
+        BlockVector
+        """
+        assert isinstance(data, np.ndarray) and data.ndim == 1, 'data needs to be a 1D numpy array'
+        offsets = [int(o) for o in offsets]
+        assert len(offsets) > 0 and offsets[0] == 0 and offsets[-1] == data.size, 'offsets do not match data'
+        nblocks = len(offsets) - 1
+        obj = cls(nblocks)
+        for idx in range(nblocks):
+            nelements = offsets[idx + 1] - offsets[idx]
+            assert nelements >= 0, 'offsets need to be non-decreasing'
+            super(BlockVector, obj).__setitem__(idx, data[offsets[idx]: offsets[idx + 1]])
+            obj._brow_lengths[idx] = nelements
+        obj._block_mask[:] = True
+        obj._nblocks_set = nblocks
+        obj._has_none = False
+        obj._size = data.size
+        obj._offsets = offsets
+        return obj
 
     def __array_prepare__(self, out_arr, context=None):
         return super(BlockVector, self).__array_prepare__(self, out_arr, context)
@@ -240,7 +286,7 @@ class BlockVector(np.ndarray):
         """
         Returns total number of elements in the block vector
         """
-        return np.sum(self._brow_lengths),
+        return self._size,
 
     @shape.setter
     def shape(self, new_shape):
@@ -251,7 +297,7 @@ class BlockVector(np.ndarray):
         """
         Returns total number of elements in the block vector
         """
-        return np.sum(self._brow_lengths)
+        return self._size
 
     @size.setter
     def size(self, new_size):
@@ -268,7 +314,7 @@ class BlockVector(np.ndarray):
     def has_none(self):
         if not self._has_none:
             return False
-        if not np.all(self._block_mask):
+        if self._nblocks_set != self._nblocks:
             return True
 
         block_arr = np.array([blk.has_none for blk in self if isinstance(blk, BlockVector)], dtype=bool)
@@ -280,7 +326,29 @@ class BlockVector(np.ndarray):
         """
         Returns array with sizes of individual blocks
         """
-        return np.copy(self._brow_lengths)
+        return np.array(self._brow_lengths, dtype=np.int64)
+
+    def _block_offsets(self):
+        """
+        Returns list with the position of the first entry of each block
+        in the flattened vector followed by the size of the vector. The
+        list is cached until the size of a block changes
+        """
+        if self._offsets is None:
+            offsets = [0] * (self._nblocks + 1)
+            accum = 0
+            for idx, nelements in enumerate(self._brow_lengths):
+                accum += nelements
+                offsets[idx + 1] = accum
+            self._offsets = offsets
+        return self._offsets
+
+    def _reduce_blocks(self, method, **kwargs):
+        """
+        Returns a generator with the result of calling the reduction
+        method on each of the blocks that are not None
+        """
+        return (getattr(blk, method)(**kwargs) for blk in self if blk is not None)
 
     def dot(self, other, out=None):
         """
@@ -298,10 +366,10 @@ class BlockVector(np.ndarray):
         assert not self.has_none, 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
         if isinstance(other, BlockVector):
             assert not other.has_none, 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
-            assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
+            assert self._size == other._size, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
             assert self.nblocks == other.nblocks, 'Number of blocks mismatch {} != {}'.format(self.nblocks,
                                                                                               other.nblocks)
-            return sum(self[i].dot(other[i]) for i in range(self.nblocks))
+            return sum(blk.dot(other_blk) for blk, other_blk in zip(self, other))
         elif isinstance(other, np.ndarray):
             bv = self.flatten()
             return bv.dot(other)
@@ -312,8 +380,7 @@ class BlockVector(np.ndarray):
         """
         Returns the sum of all entries in the block vector
         """
-        return sum(self[i].sum(axis=axis, dtype=dtype, out=out, keepdims=keepdims)
-                   for i in range(self.nblocks) if self._block_mask[i])
+        return sum(self._reduce_blocks('sum', axis=axis, dtype=dtype, out=out, keepdims=keepdims))
 
     def all(self, axis=None, out=None, keepdims=False):
         """
@@ -335,8 +402,7 @@ class BlockVector(np.ndarray):
         """
         Returns the largest value stored in the vector
         """
-        return max([self[i].max(axis=axis, out=None, keepdims=keepdims)
-                   for i in range(self.nblocks) if self._block_mask[i]])
+        return max(self._reduce_blocks('max', axis=axis, out=None, keepdims=keepdims))
 
     def argpartition(self, kth, axis=-1, kind='introselect', order=None):
         raise NotImplementedError("argpartition not implemented for BlockVector")
@@ -539,8 +605,7 @@ class BlockVector(np.ndarray):
         """
         Returns the smallest value stored in the vector
         """
-        return min([self[i].min(axis=axis, out=None, keepdims=keepdims)
-                   for i in range(self.nblocks) if self._block_mask[i]])
+        return min(self._reduce_blocks('min', axis=axis, out=None, keepdims=keepdims))
 
     def mean(self, axis=None, dtype=None, out=None, keepdims=False):
         """
@@ -555,9 +620,10 @@ class BlockVector(np.ndarray):
         """
         Returns the product of all entries in the vector
         """
-        arr = [self[i].prod(axis=axis, dtype=dtype, out=None, keepdims=keepdims)
-               for i in range(self.nblocks) if self._block_mask[i]]
-        return np.prod(arr)
+        return functools.reduce(operator.mul,
+                                self._reduce_blocks('prod', axis=axis, dtype=dtype,
+                                                    out=None, keepdims=keepdims),
+                                1)
 
     def fill(self, value):
         """
@@ -573,9 +639,9 @@ class BlockVector(np.ndarray):
         None
 
         """
-        for i in range(self.nblocks):
-            if self._block_mask[i]:
-                self[i].fill(value)
+        for blk in self:
+            if blk is not None:
+                blk.fill(value)
 
     def tolist(self):
         """
@@ -603,7 +669,8 @@ class BlockVector(np.ndarray):
         ndarray
 
         """
-        all_blocks = tuple(v.flatten(order=order) for v in self)
+        # 1d numpy blocks are passed as they are, concatenate makes the copy
+        all_blocks = [v if type(v) is np.ndarray else v.flatten(order=order) for v in self]
         return np.concatenate(all_blocks)
 
     def ravel(self, order='C'):
@@ -621,7 +688,7 @@ class BlockVector(np.ndarray):
         ndarray
 
         """
-        all_blocks = tuple(v.ravel(order=order) for v in self)
+        all_blocks = [v if type(v) is np.ndarray else v.ravel(order=order) for v in self]
         return np.concatenate(all_blocks)
 
     def argmax(self, axis=None, out=None):
@@ -667,7 +734,7 @@ class BlockVector(np.ndarray):
         value: scalar (optional)
             all entries of the cloned vector are set to this value
         copy: bool (optinal)
-            if set to true makes a deepcopy of each block in this vector. default False
+            if set to true makes a copy of each block in this vector. default False
 
         Returns
         -------
@@ -675,10 +742,12 @@ class BlockVector(np.ndarray):
         """
         result = BlockVector(self.nblocks)
         for idx, blk in enumerate(self):
-            if copy:
-                result[idx] = cp.deepcopy(blk)
-            else:
+            if not copy or blk is None:
                 result[idx] = blk
+            elif isinstance(blk, BlockVector):
+                result[idx] = blk.clone(copy=True)
+            else:
+                result[idx] = blk.copy()
             result._block_mask[idx] = self._block_mask[idx]
             result._brow_lengths[idx] = self._brow_lengths[idx]
         if value is not None:
@@ -700,25 +769,24 @@ class BlockVector(np.ndarray):
         assert not self.has_none, 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
         if isinstance(other, BlockVector):
             assert not other.has_none, 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
-            assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
+            assert self._size == other._size, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
             assert self.nblocks == other.nblocks, 'Number of blocks mismatch {} != {}'.format(self.nblocks,
                                                                                               other.nblocks)
-            for idx, blk in enumerate(other):
-                if isinstance(blk, BlockVector) or isinstance(self[idx], BlockVector):
-                    self[idx].copyfrom(blk)
+            for blk, other_blk in zip(self, other):
+                if isinstance(other_blk, BlockVector) or isinstance(blk, BlockVector):
+                    blk.copyfrom(other_blk)
                 else:
-                    np.copyto(self[idx], blk)
+                    np.copyto(blk, other_blk)
         elif isinstance(other, np.ndarray):
             assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
 
-            offset = 0
+            offsets = self._block_offsets()
             for idx, blk in enumerate(self):
-                subarray = other[offset: offset + self[idx].size]
-                if isinstance(self[idx], BlockVector):
-                    self[idx].copyfrom(subarray)
+                subarray = other[offsets[idx]: offsets[idx + 1]]
+                if isinstance(blk, BlockVector):
+                    blk.copyfrom(subarray)
                 else:
-                    np.copyto(self[idx], subarray)
-                offset += self[idx].size
+                    np.copyto(blk, subarray)
         else:
             raise NotImplementedError()
 
@@ -747,7 +815,7 @@ class BlockVector(np.ndarray):
                 if isinstance(blk, BlockVector):
                     other[idx] = blk.clone(copy=True)
                 else:
-                    other[idx] = cp.deepcopy(blk)
+                    other[idx] = blk.copy()
 
         elif isinstance(other, np.ndarray):
             assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
@@ -785,79 +853,78 @@ class BlockVector(np.ndarray):
             self[idx] = blk
 
     def _check_mask(self):
-        msg = 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
-        msg += '\n{}'.format(self.__str__())
-        if not np.all(self._block_mask):
+        if self._nblocks_set != self._nblocks:
+            msg = 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
+            msg += '\n{}'.format(self.__str__())
             raise RuntimeError(msg)
         for idx, blk in enumerate(self):
             if isinstance(blk, BlockVector):
                 blk._check_mask()
 
-    def __add__(self, other):
-        result = BlockVector(self.nblocks)
+    def _binop(self, other, ufunc):
+        """
+        Applies the binary ufunc to this vector and other. When all the
+        blocks are numpy arrays of the same type, the blocks of the
+        result are views of a single buffer
+        """
         assert not self.has_none, 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
         if isinstance(other, BlockVector):
             assert not other.has_none, 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
-            assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
+            assert self._size == other._size, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
             assert self.nblocks == other.nblocks, 'Number of blocks mismatch {} != {}'.format(self.nblocks,
                                                                                               other.nblocks)
-            for idx, blk in enumerate(self):
-                result[idx] = blk + other[idx]
-            return result
+            operands = list(other)
         elif isinstance(other, np.ndarray):
             assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
-            accum = 0
-            for idx, blk in enumerate(self):
-                nelements = self._brow_lengths[idx]
-                result[idx] = blk + other[accum: accum + nelements]
-                accum += nelements
-            return result
+            offsets = self._block_offsets()
+            operands = [other[offsets[idx]: offsets[idx + 1]] for idx in range(self.nblocks)]
         elif np.isscalar(other):
-            for idx, blk in enumerate(self):
-                result[idx] = blk + other
-            return result
+            operands = [other] * self.nblocks
         else:
             raise NotImplementedError()
 
+        blocks = list(self)
+        result = BlockVector(self.nblocks)
+        single_buffer = self.nblocks > 0 and \
+            all(type(blk) is np.ndarray for blk in blocks) and \
+            len(set(blk.dtype for blk in blocks)) == 1
+        if single_buffer and isinstance(other, BlockVector):
+            single_buffer = all(type(op) is np.ndarray for op in operands) and \
+                len(set(op.dtype for op in operands)) == 1
+
+        if not single_buffer:
+            for idx, blk in enumerate(blocks):
+                result[idx] = ufunc(blk, operands[idx])
+            return result
+
+        op0 = operands[0][:0] if isinstance(operands[0], np.ndarray) else operands[0]
+        out = np.empty(self._size, dtype=ufunc(blocks[0][:0], op0).dtype)
+        offsets = self._block_offsets()
+        for idx, blk in enumerate(blocks):
+            view = out[offsets[idx]: offsets[idx + 1]]
+            ufunc(blk, operands[idx], out=view)
+            result[idx] = view
+        return result
+
+    def __add__(self, other):
+        return self._binop(other, np.add)
+
     def __radd__(self, other):  # other + self
         return self.__add__(other)
 
     def __sub__(self, other):
-        result = BlockVector(self.nblocks)
-        assert not self.has_none, 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
-        if isinstance(other, BlockVector):
-            assert not other.has_none, 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
-            assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
-            assert self.nblocks == other.nblocks, 'Number of blocks mismatch {} != {}'.format(self.nblocks,
-                                                                                              other.nblocks)
-            for idx, blk in enumerate(self):
-                result[idx] = blk - other[idx]
-            return result
-        elif isinstance(other, np.ndarray):
-            assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
-            accum = 0
-            for idx, blk in enumerate(self):
-                nelements = self._brow_lengths[idx]
-                result[idx] = blk - other[accum: accum + nelements]
-                accum += nelements
-            return result
-        elif np.isscalar(other):
-            for idx, blk in enumerate(self):
-                result[idx] = blk - other
-            return result
-        else:
-            raise NotImplementedError()
+        return self._binop(other, np.subtract)
 
     def __rsub__(self, other):  # other - self
         result = BlockVector(self.nblocks)
         assert not self.has_none, 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
         if isinstance(other, BlockVector):
             assert not other.has_none, 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
-            assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
+            assert self._size == other._size, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
             assert self.nblocks == other.nblocks, 'Number of blocks mismatch {} != {}'.format(self.nblocks,
                                                                                               other.nblocks)
-            for idx, blk in enumerate(self):
-                result[idx] = other[idx] - blk
+            for idx, (blk, other_blk) in enumerate(zip(self, other)):
+                result[idx] = other_blk - blk
             return result
         elif isinstance(other, np.ndarray):
             assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
@@ -875,70 +942,24 @@ class BlockVector(np.ndarray):
             raise NotImplementedError()
 
     def __mul__(self, other):
-        assert not self.has_none, 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
-        result = BlockVector(self.nblocks)
-        if isinstance(other, BlockVector):
-            assert not other.has_none, 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
-            assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
-            assert self.nblocks == other.nblocks, 'Number of blocks mismatch {} != {}'.format(self.nblocks,
-                                                                                              other.nblocks)
-            for idx, blk in enumerate(self):
-                result[idx] = blk .__mul__(other[idx])
-            return result
-        elif isinstance(other, np.ndarray):
-            assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
-            accum = 0
-            for idx, blk in enumerate(self):
-                nelements = self._brow_lengths[idx]
-                result[idx] = blk.__mul__(other[accum: accum + nelements])
-                accum += nelements
-            return result
-        elif np.isscalar(other):
-            for idx, blk in enumerate(self):
-                result[idx] = blk.__mul__(other)
-            return result
-        else:
-            raise NotImplementedError()
+        return self._binop(other, np.multiply)
 
     def __rmul__(self, other):  # other + self
         return self.__mul__(other)
 
     def __truediv__(self, other):
-        assert not self.has_none, 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
-        result = BlockVector(self.nblocks)
-        if isinstance(other, BlockVector):
-            assert not other.has_none, 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
-            assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
-            assert self.nblocks == other.nblocks, 'Number of blocks mismatch {} != {}'.format(self.nblocks,
-                                                                                              other.nblocks)
-            for idx, blk in enumerate(self):
-                result[idx] = blk.__truediv__(other[idx])
-            return result
-        elif isinstance(other, np.ndarray):
-            assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
-            accum = 0
-            for idx, blk in enumerate(self):
-                nelements = self._brow_lengths[idx]
-                result[idx] = blk.__truediv__(other[accum: accum + nelements])
-                accum += nelements
-            return result
-        elif np.isscalar(other):
-            for idx, blk in enumerate(self):
-                result[idx] = blk.__truediv__(other)
-            return result
-        else:
-            raise NotImplementedError()
+        return self._binop(other, np.true_divide)
 
     def __rtruediv__(self, other):
         assert not self.has_none, 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
         result = BlockVector(self.nblocks)
         if isinstance(other, BlockVector):
             assert not other.has_none, 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
-            assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
+            assert self._size == other._size, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
             assert self.nblocks == other.nblocks, 'Number of blocks mismatch {} != {}'.format(self.nblocks,
                                                                                               other.nblocks)
-            for idx, blk in enumerate(self):
-                result[idx] = other[idx].__rtruediv__(blk)
+            for idx, (blk, other_blk) in enumerate(zip(self, other)):
+                result[idx] = other_blk.__rtruediv__(blk)
             return result
         elif isinstance(other, np.ndarray):
             assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
@@ -960,11 +981,11 @@ class BlockVector(np.ndarray):
         result = BlockVector(self.nblocks)
         if isinstance(other, BlockVector):
             assert not other.has_none, 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
-            assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
+            assert self._size == other._size, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
             assert self.nblocks == other.nblocks, 'Number of blocks mismatch {} != {}'.format(self.nblocks,
                                                                                               other.nblocks)
-            for idx, blk in enumerate(self):
-                result[idx] = blk.__floordiv__(other[idx])
+            for idx, (blk, other_blk) in enumerate(zip(self, other)):
+                result[idx] = blk.__floordiv__(other_blk)
             return result
         elif isinstance(other, np.ndarray):
             assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
@@ -986,11 +1007,11 @@ class BlockVector(np.ndarray):
         result = BlockVector(self.nblocks)
         if isinstance(other, BlockVector):
             assert not other.has_none, 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
-            assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
+            assert self._size == other._size, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
             assert self.nblocks == other.nblocks, 'Number of blocks mismatch {} != {}'.format(self.nblocks,
                                                                                               other.nblocks)
-            for idx, blk in enumerate(self):
-                result[idx] = other[idx].__rfloordiv__(blk)
+            for idx, (blk, other_blk) in enumerate(zip(self, other)):
+                result[idx] = other_blk.__rfloordiv__(blk)
             return result
         elif isinstance(other, np.ndarray):
             assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
@@ -1007,105 +1028,66 @@ class BlockVector(np.ndarray):
         else:
             raise NotImplementedError()
 
-    def __iadd__(self, other):
+    def __neg__(self):
         assert not self.has_none, 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
-        if np.isscalar(other):
-            for idx, blk in enumerate(self):
-                self[idx] = self[idx] + other # maybe it suffice with doing self[idx] = self[idf] + other
-            return self
-        elif isinstance(other, BlockVector):
-            assert not other.has_none, 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
-            assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
-            assert self.nblocks == other.nblocks, 'Number of blocks mismatch {} != {}'.format(self.nblocks,
-                                                                                              other.nblocks)
-            for idx, blk in enumerate(self):
-                self[idx] = self[idx] + other[idx]
-            return self
-        elif isinstance(other, np.ndarray):
-            assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
-            accum = 0
-            for idx, blk in enumerate(self):
-                nelements = self._brow_lengths[idx]
-                self[idx] = blk + other[accum: accum + nelements]
-                accum += nelements
-            return self
-        else:
-            raise NotImplementedError()
+        result = BlockVector(self.nblocks)
+        for idx, blk in enumerate(self):
+            result[idx] = -blk
+        return result
 
-    def __isub__(self, other):
+    def axpy(self, alpha, other):
+        """
+        Adds alpha * other to this vector. The blocks are updated in place
+
+        Parameters
+        ----------
+        alpha: scalar
+        other: BlockVector or ndarray
+
+        Returns
+        -------
+        None
+        """
         assert not self.has_none, 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
-        if np.isscalar(other):
-            for idx, blk in enumerate(self):
-                self[idx] = self[idx] - other
-            return self
-        elif isinstance(other, BlockVector):
+        if isinstance(other, BlockVector):
             assert not other.has_none, 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
-            assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
+            assert self._size == other._size, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
             assert self.nblocks == other.nblocks, 'Number of blocks mismatch {} != {}'.format(self.nblocks,
                                                                                               other.nblocks)
-            for idx, blk in enumerate(self):
-                self[idx] = self[idx] - other[idx]
-            return self
+            operands = list(other)
         elif isinstance(other, np.ndarray):
             assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
-            accum = 0
-            for idx, blk in enumerate(self):
-                nelements = self._brow_lengths[idx]
-                self[idx] = blk - other[accum: accum + nelements]
-                accum += nelements
-            return self
+            offsets = self._block_offsets()
+            operands = [other[offsets[idx]: offsets[idx + 1]] for idx in range(self.nblocks)]
         else:
             raise NotImplementedError()
 
+        for blk, x in zip(self, operands):
+            if isinstance(blk, BlockVector):
+                blk.axpy(alpha, x)
+            elif type(x) is np.ndarray and blk.dtype == np.float64 and x.dtype == np.float64 \
+                    and blk.flags.c_contiguous and blk.flags.aligned and blk.flags.writeable:
+                # daxpy updates blk in place (and ignores the writeable flag)
+                blas.daxpy(x, blk, a=alpha)
+            else:
+                np.add(blk, alpha * x, out=blk)
+
+    def __iadd__(self, other):
+        # blocks are replaced (not modified) by views of a single buffer
+        self.set_blocks(list(self._binop(other, np.add)))
+        return self
+
+    def __isub__(self, other):
+        self.set_blocks(list(self._binop(other, np.subtract)))
+        return self
+
     def __imul__(self, other):
-        assert not self.has_none, 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
-        if np.isscalar(other):
-            for idx, blk in enumerate(self):
-                self[idx] = self[idx] * other
-            return self
-        elif isinstance(other, BlockVector):
-            assert not other.has_none, 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
-            assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
-            assert self.nblocks == other.nblocks, 'Number of blocks mismatch {} != {}'.format(self.nblocks,
-                                                                                              other.nblocks)
-            for idx, blk in enumerate(self):
-                self[idx] = self[idx] * other[idx]
-            return self
-        elif isinstance(other, np.ndarray):
-            assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
-            accum = 0
-            for idx, blk in enumerate(self):
-                nelements = self._brow_lengths[idx]
-                self[idx] = blk * other[accum: accum + nelements]
-                accum += nelements
-            return self
-        else:
-            raise NotImplementedError()
+        self.set_blocks(list(self._binop(other, np.multiply)))
+        return self
 
     def __itruediv__(self, other):
-        assert not self.has_none, 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
-        if np.isscalar(other):
-            for idx, blk in enumerate(self):
-                self[idx] = self[idx] / other
-            return self
-        elif isinstance(other, BlockVector):
-            assert not other.has_none, 'Operation not allowed with None blocks. Specify all blocks in BlockVector'
-            assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
-            assert self.nblocks == other.nblocks, 'Number of blocks mismatch {} != {}'.format(self.nblocks,
-                                                                                              other.nblocks)
-            for idx, blk in enumerate(self):
-                self[idx] = self[idx] / other[idx]
-            return self
-        elif isinstance(other, np.ndarray):
-            assert self.shape == other.shape, 'Dimension mismatch {} != {}'.format(self.shape, other.shape)
-            accum = 0
-            for idx, blk in enumerate(self):
-                nelements = self._brow_lengths[idx]
-                self[idx] = blk / other[accum: accum + nelements]
-                accum += nelements
-            return self
-        else:
-            raise NotImplementedError()
+        self.set_blocks(list(self._binop(other, np.true_divide)))
+        return self
 
     def __str__(self):
         msg = ''
@@ -1138,19 +1120,27 @@ class BlockVector(np.ndarray):
         if isinstance(key, slice):
             raise NotImplementedError()
 
-        assert -self.nblocks < key < self.nblocks, 'out of range'
+        assert -self._nblocks <= key < self._nblocks, 'out of range'
         if value is None:
             super(BlockVector, self).__setitem__(key, None)
+            self._nblocks_set -= int(self._block_mask[key])
             self._block_mask[key] = False
-            self._brow_lengths[key] = 0
+            if self._brow_lengths[key] != 0:
+                self._size -= self._brow_lengths[key]
+                self._brow_lengths[key] = 0
+                self._offsets = None
             self._has_none = True
         else:
-            msg = 'Blocks need to be numpy arrays or BlockVectors'
-            assert isinstance(value, np.ndarray) or isinstance(value, BlockVector), msg
+            # BlockVector is a subclass of ndarray
+            assert isinstance(value, np.ndarray), 'Blocks need to be numpy arrays or BlockVectors'
             assert value.ndim == 1, 'Blocks need to be 1D'
             super(BlockVector, self).__setitem__(key, value)
+            self._nblocks_set += int(not self._block_mask[key])
             self._block_mask[key] = True
-            self._brow_lengths[key] = value.size
+            if self._brow_lengths[key] != value.size:
+                self._size += value.size - self._brow_lengths[key]
+                self._brow_lengths[key] = value.size
+                self._offsets = None
 
     def __le__(self, other):
 
@@ -142,6 +142,15 @@ class TestBlockMatrix(unittest.TestCase):
         self.assertListEqual(res_dinopy.tolist(), res_scipy.tolist())
         self.assertListEqual(res_dinopy_flat.tolist(), res_scipy.tolist())
 
+        # check dot product with rectangular and empty blocks
+        m = BlockMatrix(2, 2)
+        m[0, 1] = coo_matrix(np.arange(6.0).reshape(2, 3))
+        m[1, 0] = coo_matrix(np.ones((4, 2)))
+        m[1, 1] = coo_matrix(np.ones((4, 3)))
+        x = np.arange(5.0)
+        res_scipy = m.tocoo().dot(x)
+        self.assertListEqual((m * x).tolist(), res_scipy.tolist())
+
         dense_mat = dinopy_mat.todense()
         self.basic_m *= 5.0
         self.assertTrue(np.allclose(dense_mat, self.basic_m.todense()))
@@ -253,6 +262,17 @@ class TestBlockMatrix(unittest.TestCase):
         A_block_t = A_block.transpose()
         self.assertTrue(np.allclose(A_dense_t, A_block_t.todense()))
 
+    def test_copy(self):
+        m = self.composed_m
+        mc = m.copy()
+        self.assertIsInstance(mc, BlockMatrix)
+        self.assertTrue(np.allclose(mc.toarray(), m.toarray()))
+        self.assertIsNot(mc[0, 0], m[0, 0])
+        self.assertIsInstance(mc[1, 1], BlockMatrix)
+        self.assertIsNot(mc[1, 1], m[1, 1])
+        self.assertIsNot(mc[1, 1][0, 1], m[1, 1][0, 1])
+        self.assertTrue(mc.is_empty_block(0, 1))
+
     def test_repr(self):
         self.assertEqual(len(self.basic_m.__repr__()), 17)
 
@@ -282,6 +302,25 @@ class TestBlockMatrix(unittest.TestCase):
         mm = A_block.__radd__(A_block)
         self.assertTrue(np.allclose(aa, mm.todense()))
 
+        B_block = BlockMatrix(2, 2)
+        B_block[0, 0] = self.block_m
+        B_block[1, 1] = coo_matrix(self.block_m.shape)
+        mm = A_block + B_block
+        self.assertIsNot(mm[1, 1], A_block[1, 1])
+        self.assertTrue(np.allclose(mm.todense(), A_dense + B_block.todense()))
+        mm = A_block - B_block
+        self.assertIsNot(mm[1, 1], A_block[1, 1])
+        self.assertTrue(np.allclose(mm.todense(), A_dense - B_block.todense()))
+
+        # empty blocks must still have matching shapes
+        B_block = BlockMatrix(2, 2)
+        B_block[0, 0] = self.block_m
+        B_block[1, 1] = coo_matrix((3, 3))
+        with self.assertRaises(AssertionError):
+            A_block + B_block
+        with self.assertRaises(AssertionError):
+            A_block - B_block
+
     def test_sub(self):
 
         A_dense = self.basic_m.todense()
@@ -377,7 +416,47 @@ class TestSymBlockMatrix(unittest.TestCase):
 
         self.basic_m *= 5.0
         self.assertTrue(np.allclose(self.basic_m.todense(), dense_m, atol=1e-3))
-    # ToDo: Add test for transpose
+
+    def test_add_sub(self):
+        m = self.basic_m
+        dense_m = m.toarray()
+
+        mm = m + m
+        self.assertIsInstance(mm, BlockSymMatrix)
+        self.assertTrue(np.allclose(mm.toarray(), 2 * dense_m))
+
+        other = BlockSymMatrix(2)
+        other[0, 0] = self.block00
+        other[1, 1] = self.block11
+        mm = m - other
+        self.assertIsInstance(mm, BlockSymMatrix)
+        self.assertTrue(np.allclose(mm.toarray(), dense_m - other.toarray()))
+        mm = other - m
+        self.assertTrue(np.allclose(mm.toarray(), other.toarray() - dense_m))
+
+    def test_transpose(self):
+        m = self.basic_m
+        self.assertIs(m.transpose(), m)
+        mt = m.transpose(copy=True)
+        self.assertIsInstance(mt, BlockSymMatrix)
+        self.assertIsNot(mt, m)
+        self.assertIsNot(mt[1, 0], m[1, 0])
+        self.assertTrue(np.allclose(mt.toarray(), m.toarray().T))
+
+        # nested block matrices
+        off_diag = BlockMatrix(1, 2)
+        off_diag[0, 0] = self.block10
+        off_diag[0, 1] = self.block11
+        nested = BlockSymMatrix(2)
+        nested[0, 0] = m
+        nested[1, 0] = off_diag
+        nested[1, 1] = self.block11
+        nt = nested.transpose(copy=True)
+        self.assertIsInstance(nt[0, 0], BlockSymMatrix)
+        self.assertIsNot(nt[0, 0], nested[0, 0])
+        self.assertIsInstance(nt[1, 0], BlockMatrix)
+        self.assertIsNot(nt[1, 0], nested[1, 0])
+        self.assertTrue(np.allclose(nt.toarray(), nested.toarray()))
 
 
 
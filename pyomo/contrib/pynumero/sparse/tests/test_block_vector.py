@@ -16,6 +16,7 @@ if not (pn.sparse.numpy_available and pn.sparse.scipy_available):
 
 import numpy as np
 from pyomo.contrib.pynumero.sparse.block_vector import BlockVector
+from pyomo.contrib.pynumero.linalg.intrinsics import norm
 
 
 class TestBlockVector(unittest.TestCase):
@@ -39,12 +40,18 @@ class TestBlockVector(unittest.TestCase):
         with self.assertRaises(Exception) as context:
             BlockVector('hola')
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        # reference data that no test modifies
+        cls.list_sizes_ones = [2, 4, 3]
+        cls.arange_blocks = (np.arange(5), np.arange(9))
+        cls.arange_flat = np.concatenate(cls.arange_blocks)
+        cls.arange_flat.flags.writeable = False
 
-        self.ones = BlockVector(3)
-        self.list_sizes_ones = [2, 4, 3]
-        for idx, s in enumerate(self.list_sizes_ones):
-            self.ones[idx] = np.ones(s)
+    def setUp(self):
+        # block vectors are rebuilt since several tests modify them
+        self.ones = BlockVector([np.ones(s) for s in self.list_sizes_ones])
+        self.arange_v = BlockVector([blk.copy() for blk in self.arange_blocks])
 
     def test_block_sizes(self):
         self.assertListEqual(self.ones.block_sizes().tolist(), self.list_sizes_ones)
@@ -67,10 +74,7 @@ class TestBlockVector(unittest.TestCase):
 
     def test_sum(self):
         self.assertEqual(self.ones.sum(), self.ones.size)
-        v = BlockVector(2)
-        v[0] = np.arange(5)
-        v[1] = np.arange(9)
-        self.assertEqual(v.sum(), 46)
+        self.assertEqual(self.arange_v.sum(), 46)
 
     def test_all(self):
 
@@ -346,51 +350,21 @@ class TestBlockVector(unittest.TestCase):
 
     def test_prod(self):
         self.assertEqual(self.ones.prod(), 1)
-        v = BlockVector(2)
-        a = np.arange(5)
-        b = np.arange(9)
-        c = np.concatenate([a, b])
-        v[0] = a
-        v[1] = b
-        self.assertEqual(v.prod(), c.prod())
+        self.assertEqual(self.arange_v.prod(), self.arange_flat.prod())
 
     def test_max(self):
         self.assertEqual(self.ones.max(), 1)
-        v = BlockVector(2)
-        a = np.arange(5)
-        b = np.arange(9)
-        c = np.concatenate([a, b])
-        v[0] = a
-        v[1] = b
-        self.assertEqual(v.max(), c.max())
+        self.assertEqual(self.arange_v.max(), self.arange_flat.max())
 
     def test_min(self):
         self.assertEqual(self.ones.min(), 1)
-        v = BlockVector(2)
-        a = np.arange(5)
-        b = np.arange(9)
-        c = np.concatenate([a, b])
-        v[0] = a
-        v[1] = b
-        self.assertEqual(v.min(), c.min())
+        self.assertEqual(self.arange_v.min(), self.arange_flat.min())
 
     def test_tolist(self):
-        v = BlockVector(2)
-        a = np.arange(5)
-        b = np.arange(9)
-        c = np.concatenate([a, b])
-        v[0] = a
-        v[1] = b
-        self.assertListEqual(v.tolist(), c.tolist())
+        self.assertListEqual(self.arange_v.tolist(), self.arange_flat.tolist())
 
     def test_flatten(self):
-        v = BlockVector(2)
-        a = np.arange(5)
-        b = np.arange(9)
-        c = np.concatenate([a, b])
-        v[0] = a
-        v[1] = b
-        self.assertListEqual(v.flatten().tolist(), c.tolist())
+        self.assertListEqual(self.arange_v.flatten().tolist(), self.arange_flat.tolist())
 
     def test_fill(self):
         v = BlockVector(2)
@@ -412,6 +386,12 @@ class TestBlockVector(unittest.TestCase):
     def test_size(self):
         size = sum(self.list_sizes_ones)
         self.assertEqual(self.ones.size, size)
+        v = self.ones
+        v[1] = np.ones(7)
+        self.assertEqual(v.size, size + 3)
+        v[1] = None
+        self.assertEqual(v.size, size - 4)
+        self.assertEqual(v.shape, (size - 4,))
 
     def test_argmax(self):
         v = BlockVector(2)
@@ -475,6 +455,18 @@ class TestBlockVector(unittest.TestCase):
         with self.assertRaises(Exception) as context:
             result = v + 'hola'
 
+    def test_add_nested_and_mixed_types(self):
+        v = BlockVector([np.arange(3), np.ones(2)])
+        result = v + 1
+        self.assertEqual(result[0].dtype, np.arange(3).dtype)
+        self.assertEqual(result[1].dtype, np.float64)
+        self.assertListEqual(result.tolist(), [1, 2, 3, 2, 2])
+
+        nested = BlockVector([self.ones, np.ones(2)])
+        result = nested + nested
+        self.assertIsInstance(result[0], BlockVector)
+        self.assertListEqual(result.tolist(), [2] * nested.size)
+
     def test_radd(self):
         v = self.ones
         v1 = self.ones
@@ -690,6 +682,37 @@ class TestBlockVector(unittest.TestCase):
         with self.assertRaises(Exception) as context:
             v *= 'hola'
 
+    def test_neg(self):
+        v = self.ones
+        result = -v
+        self.assertIsInstance(result, BlockVector)
+        self.assertListEqual(result.tolist(), [-1] * v.size)
+        self.assertListEqual(v.tolist(), [1] * v.size)
+
+    def test_axpy(self):
+        v = self.ones
+        v1 = v.clone(2.0, copy=True)
+        v.axpy(3.0, v1)
+        self.assertListEqual(v.tolist(), [7] * v.size)
+        self.assertListEqual(v1.tolist(), [2] * v.size)
+        v.axpy(-1.0, np.ones(v.size))
+        self.assertListEqual(v.tolist(), [6] * v.size)
+
+        w = BlockVector([np.arange(3), v.clone(0.0)])
+        w.axpy(2, np.ones(w.size, dtype=np.int64))
+        self.assertListEqual(w.tolist(), [2, 3, 4] + [2] * v.size)
+
+        with self.assertRaises(Exception) as context:
+            v.axpy(1.0, 'hola')
+
+        # read-only blocks are not modified
+        a = np.ones(3)
+        a.flags.writeable = False
+        w = BlockVector([a, np.ones(2)])
+        with self.assertRaises(ValueError):
+            w.axpy(1.0, np.ones(5))
+        self.assertListEqual(a.tolist(), [1.0] * 3)
+
     def test_getitem(self):
         v = self.ones
         for i, s in enumerate(self.list_sizes_ones):
@@ -724,6 +747,12 @@ class TestBlockVector(unittest.TestCase):
         self.assertTrue(v.has_none)
         v[0] = np.ones(2)
         self.assertFalse(v.has_none)
+        v[1] = None
+        v[1] = None
+        self.assertTrue(v.has_none)
+        v[1] = np.ones(4)
+        v[1] = np.ones(4)
+        self.assertFalse(v.has_none)
 
     def test_copyfrom(self):
         v = self.ones
@@ -744,6 +773,28 @@ class TestBlockVector(unittest.TestCase):
         v3[1] = np.zeros(3)
         self.assertListEqual(v3.tolist(), v4.tolist() + [0]*3)
 
+        v5 = BlockVector([np.zeros(2), np.zeros(3)])
+        v5.copyfrom(np.arange(5, dtype=np.double))
+        v5[0] = np.zeros(3)
+        v5.copyfrom(np.arange(6, dtype=np.double))
+        self.assertListEqual(v5[0].tolist(), [0, 1, 2])
+        self.assertListEqual(v5[1].tolist(), [3, 4, 5])
+
+    def test_from_flat(self):
+        data = np.arange(6, dtype=np.double)
+        v = BlockVector.from_flat(data, [0, 2, 2, 6])
+        self.assertEqual(v.nblocks, 3)
+        self.assertEqual(v.size, 6)
+        self.assertFalse(v.has_none)
+        self.assertListEqual(v.block_sizes().tolist(), [2, 0, 4])
+        self.assertListEqual(v.tolist(), data.tolist())
+        data[0] = 10.0
+        self.assertEqual(v[0][0], 10.0)
+        v2 = v + v
+        self.assertListEqual(v2.tolist(), (2 * data).tolist())
+        with self.assertRaises(Exception) as context:
+            BlockVector.from_flat(data, [0, 2, 5])
+
     def test_copyto(self):
         v = self.ones
         v2 = BlockVector(len(self.list_sizes_ones))
@@ -1059,5 +1110,26 @@ class TestBlockVector(unittest.TestCase):
             res = fun(v, v2)
             self.assertTrue(np.allclose(flat_res, res.flatten()))
 
+    def test_norm(self):
+        v = BlockVector(3)
+        v[0] = np.array([3.0, -4.0])
+        v[1] = np.zeros(0)
+        v[2] = np.array([1.0, -7.0, 2.0])
+        for ord in [None, 2, 1, np.inf]:
+            self.assertAlmostEqual(norm(v, ord=ord),
+                                   np.linalg.norm(v.flatten(), ord=ord))
+
+        v = BlockVector(2)
+        v[0] = np.zeros(0)
+        v[1] = np.zeros(0)
+        self.assertEqual(norm(v, ord=np.inf), 0.0)
+
+        v = BlockVector(2)
+        v[0] = np.array([3.0 + 4.0j])
+        v[1] = np.array([1.0j, -2.0])
+        for ord in [None, 2, 1, np.inf]:
+            self.assertAlmostEqual(norm(v, ord=ord),
+                                   np.linalg.norm(v.flatten(), ord=ord))
+
 if __name__ == '__main__':
     unittest.main()
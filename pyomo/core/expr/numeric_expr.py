@@ -1576,7 +1576,8 @@ def decompose_term(expr):
         return True, [(1,expr)]
     else:
         try:
-            terms = [t_ for t_ in _decompose_linear_terms(expr)]
+            terms = []
+            _collect_linear_terms(expr, 1, terms)
             return True, terms
         except LinearDecompositionError:
             return False, None
@@ -1605,47 +1606,63 @@ def _decompose_linear_terms(expr, multiplier=1):
     Raises:
         :class:`LinearDecompositionError` if a nonlinear term is encountered.
     """
-    if expr.__class__ in native_numeric_types or not expr.is_potentially_variable():
-        yield (multiplier*expr,None)
-    elif expr.is_variable_type():
-        yield (multiplier,expr)
-    elif expr.__class__ is MonomialTermExpression:
-        yield (multiplier*expr._args_[0], expr._args_[1])
-    elif expr.__class__ is ProductExpression:
-        if expr._args_[0].__class__ in native_numeric_types or not expr._args_[0].is_potentially_variable():
-            for term in _decompose_linear_terms(expr._args_[1], multiplier*expr._args_[0]):
-                yield term
-        elif expr._args_[1].__class__ in native_numeric_types or not expr._args_[1].is_potentially_variable():
-            for term in _decompose_linear_terms(expr._args_[0], multiplier*expr._args_[1]):
-                yield term
-        else:
-            raise LinearDecompositionError("Quadratic terms exist in a product expression.")
-    elif expr.__class__ is DivisionExpression:
-        if expr._args_[1].__class__ in native_numeric_types or not expr._args_[1].is_potentially_variable():
-            for term in _decompose_linear_terms(expr._args_[0], multiplier/expr._args_[1]):
-                yield term
+    terms = []
+    _collect_linear_terms(expr, multiplier, terms)
+    for term in terms:
+        yield term
+
+
+def _collect_linear_terms(expr, multiplier, terms):
+    """
+    Append the linear terms in an expression to a list.
+
+    This is the worker for :func:`_decompose_linear_terms`.  The tree
+    is walked with an explicit stack of ``(expr, multiplier)`` pairs, so
+    deeply nested expressions do not hit the recursion limit.  Children
+    are pushed in reverse so that terms are appended in the order they
+    appear in the expression.
+
+    Raises:
+        :class:`LinearDecompositionError` if a nonlinear term is encountered.
+    """
+    stack = [(expr, multiplier)]
+    while stack:
+        expr, multiplier = stack.pop()
+        if expr.__class__ in native_numeric_types or not expr.is_potentially_variable():
+            terms.append((multiplier*expr,None))
+        elif expr.is_variable_type():
+            terms.append((multiplier,expr))
+        elif expr.__class__ is MonomialTermExpression:
+            terms.append((multiplier*expr._args_[0], expr._args_[1]))
+        elif expr.__class__ is ProductExpression:
+            if expr._args_[0].__class__ in native_numeric_types or not expr._args_[0].is_potentially_variable():
+                stack.append((expr._args_[1], multiplier*expr._args_[0]))
+            elif expr._args_[1].__class__ in native_numeric_types or not expr._args_[1].is_potentially_variable():
+                stack.append((expr._args_[0], multiplier*expr._args_[1]))
+            else:
+                raise LinearDecompositionError("Quadratic terms exist in a product expression.")
+        elif expr.__class__ is DivisionExpression:
+            if expr._args_[1].__class__ in native_numeric_types or not expr._args_[1].is_potentially_variable():
+                stack.append((expr._args_[0], multiplier/expr._args_[1]))
+            else:
+                raise LinearDecompositionError("Unexpected nonlinear term (division)")
+        elif expr.__class__ is ReciprocalExpression:
+            # The argument is potentially variable, so this represents a nonlinear term
+            #
+            # NOTE: We're ignoring possible simplifications
+            raise LinearDecompositionError("Unexpected nonlinear term")
+        elif expr.__class__ is SumExpression or expr.__class__ is _MutableSumExpression:
+            stack.extend((arg, multiplier) for arg in reversed(expr.args))
+        elif expr.__class__ is NegationExpression:
+            stack.append((expr._args_[0], -multiplier))
+        elif expr.__class__ is LinearExpression or expr.__class__ is _MutableLinearExpression:
+            if not (expr.constant.__class__ in native_numeric_types and expr.constant == 0):
+                terms.append((multiplier*expr.constant,None))
+            if len(expr.linear_coefs) > 0:
+                for c,v in zip(expr.linear_coefs, expr.linear_vars):
+                    terms.append((multiplier*c,v))
         else:
-            raise LinearDecompositionError("Unexpected nonlinear term (division)")
-    elif expr.__class__ is ReciprocalExpression:
-        # The argument is potentially variable, so this represents a nonlinear term
-        #
-        # NOTE: We're ignoring possible simplifications
-        raise LinearDecompositionError("Unexpected nonlinear term")
-    elif expr.__class__ is SumExpression or expr.__class__ is _MutableSumExpression:
-        for arg in expr.args:
-            for term in _decompose_linear_terms(arg, multiplier):
-                yield term
-    elif expr.__class__ is NegationExpression:
-        for term in  _decompose_linear_terms(expr._args_[0], -multiplier):
-            yield term
-    elif expr.__class__ is LinearExpression or expr.__class__ is _MutableLinearExpression:
-        if not (expr.constant.__class__ in native_numeric_types and expr.constant == 0):
-            yield (multiplier*expr.constant,None)
-        if len(expr.linear_coefs) > 0:
-            for c,v in zip(expr.linear_coefs, expr.linear_vars):
-                yield (multiplier*c,v)
-    else:
-        raise LinearDecompositionError("Unexpected nonlinear term")   #pragma: no cover
+            raise LinearDecompositionError("Unexpected nonlinear term")   #pragma: no cover
 
 
 def _process_arg(obj):
@@ -1674,6 +1691,33 @@ def _generate_sum_expression(etype, _self, _other):
     if etype > _inplace:
         etype -= _inplace
 
+    if etype == _add:
+        #
+        # Fast path for the common "var + var" and "var + constant"
+        # cases.  For _add and _radd, _self is always a NumericValue.
+        #
+        if _other.__class__ in native_numeric_types:
+            if _self.is_variable_type():
+                if _other == 0:
+                    return _self
+                return SumExpression([_self, _other])
+        elif _other.__class__ not in native_types and _self.is_variable_type():
+            try:
+                if _other.is_variable_type():
+                    return SumExpression([_self, _other])
+            except AttributeError:
+                # e.g., an indexed component; the general path will
+                # generate the appropriate error
+                pass
+    elif etype == _radd:
+        #
+        # Fast path for "constant + var"
+        #
+        if _other.__class__ in native_numeric_types and _self.is_variable_type():
+            if _other == 0:
+                return _self
+            return SumExpression([_other, _self])
+
     if _self.__class__ is _MutableLinearExpression:
         try:
             if etype >= _unary:
@@ -1818,6 +1862,27 @@ def _generate_mul_expression(etype, _self, _other):
     if etype > _inplace:
         etype -= _inplace
 
+    if _other.__class__ in native_numeric_types:
+        #
+        # Fast path for the common "var * constant", "constant * var"
+        # and "var / constant" cases.  For these operations, _self is
+        # always a NumericValue.
+        #
+        if etype == _mul or etype == _rmul:
+            if _self.is_variable_type():
+                if _other == 0:
+                    return 0
+                elif _other == 1:
+                    return _self
+                return MonomialTermExpression((_other, _self))
+        elif etype == _div:
+            if _self.is_variable_type():
+                if _other == 1:
+                    return _self
+                elif not _other:
+                    raise ZeroDivisionError()
+                return MonomialTermExpression((1/_other, _self))
+
     if _self.__class__ is _MutableLinearExpression:
         try:
             if _other.__class__ is not _MutableLinearExpression:
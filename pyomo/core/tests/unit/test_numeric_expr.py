@@ -11,6 +11,7 @@
 # Unit Tests for expression generation
 #
 
+import contextlib
 import copy
 import pickle
 import math
@@ -52,7 +53,7 @@ from pyomo.core.expr.visitor import (
     identify_variables, identify_components, identify_mutable_parameters,
 )
 from pyomo.core.expr.current import Expr_if
-from pyomo.core.base.var import SimpleVar
+from pyomo.core.base.var import SimpleVar, _GeneralVarData
 from pyomo.core.base.param import _ParamData, SimpleParam
 from pyomo.core.base.label import *
 from pyomo.core.base.template_expr import IndexTemplate
@@ -60,17 +61,45 @@ from pyomo.core.expr.expr_errors import TemplateExpressionError
 
 from pyomo.repn import generate_standard_repn
 
+
+@contextlib.contextmanager
+def reset_chained_inequality():
+    """ Clear the 'chainedInequality' value when leaving the block. """
+    try:
+        yield
+    finally:
+        if logical_expr._using_chained_inequality:
+            logical_expr._chainedInequality.prev = None
+
+
+_constant_cache = {}
+
+def _constant(val):
+    """ Return a shared NumericConstant for the given value. """
+    # NumericConstant is immutable, so one instance per value can be
+    # reused by every test.  The type is part of the key so that 1,
+    # 1.0 and True are not conflated.
+    key = (type(val), val)
+    try:
+        return _constant_cache[key]
+    except KeyError:
+        ans = _constant_cache[key] = NumericConstant(val)
+        return ans
+
+def tearDownModule():
+    _constant_cache.clear()
+
+
 class TestExpression_EvaluateNumericConstant(unittest.TestCase):
 
-    def setUp(self):
-        # Do we expect arithmetic operations to return expressions?
-        self.expectExpression = False
-        # Do we expect relational tests to return constant expressions?
-        self.expectConstExpression = True
+    # Do we expect arithmetic operations to return expressions?
+    expectExpression = False
+    # Do we expect relational tests to return constant expressions?
+    expectConstExpression = True
 
     def create(self, val, domain):
         # Create the type of expression term that we are testing
-        return NumericConstant(val)
+        return _constant(val)
 
     @nottest
     def value_test(self, exp, val, expectExpression=None):
@@ -109,7 +138,7 @@ class TestExpression_EvaluateNumericConstant(unittest.TestCase):
         #
         # Check that the expression evaluates correctly in a Boolean context
         #
-        try:
+        with reset_chained_inequality():
             if expectConstExpression:
                 #
                 # The relational expression should be a constant.
@@ -137,62 +166,40 @@ class TestExpression_EvaluateNumericConstant(unittest.TestCase):
                 #
                 if logical_expr._using_chained_inequality:
                     self.assertIs(exp,logical_expr._chainedInequality.prev)
-        finally:
-            #
-            # TODO: Why would we get here?  Because the expression isn't constant?
-            #
-            # Check that the 'chainedInequality' value is None
-            #
-            if logical_expr._using_chained_inequality:
-                logical_expr._chainedInequality.prev = None
 
-    def test_lt(self):
+    def relation_operands(self):
         #
-        # Test the 'less than' operator
+        # The operand pairs checked by the relational operator tests
         #
         a=self.create(1.3, Reals)
         b=self.create(2.0, Reals)
-        self.relation_test(a<b, True)
-        self.relation_test(a<a, False) 
-        self.relation_test(b<a, False)
-        self.relation_test(a<2.0, True)
-        self.relation_test(a<1.3, False)
-        self.relation_test(b<1.3, False)
-        self.relation_test(1.3<b, True)
-        self.relation_test(1.3<a, False)
-        self.relation_test(2.0<a, False)
+        return [(a, b), (a, a), (b, a),
+                (a, 2.0), (a, 1.3), (b, 1.3),
+                (1.3, b), (1.3, a), (2.0, a)]
+
+    def test_lt(self):
+        #
+        # Test the 'less than' operator
+        #
+        expected = [True, False, False, True, False, False, True, False, False]
+        for (lhs, rhs), val in zip(self.relation_operands(), expected):
+            self.relation_test(lhs<rhs, val)
 
     def test_gt(self):
         #
         # Test the 'greater than' operator
         #
-        a=self.create(1.3, Reals)
-        b=self.create(2.0, Reals)
-        self.relation_test(a>b, False)
-        self.relation_test(a>a, False)
-        self.relation_test(b>a, True)
-        self.relation_test(a>2.0, False)
-        self.relation_test(a>1.3, False)
-        self.relation_test(b>1.3, True)
-        self.relation_test(1.3>b, False)
-        self.relation_test(1.3>a, False)
-        self.relation_test(2.0>a, True)
+        expected = [False, False, True, False, False, True, False, False, True]
+        for (lhs, rhs), val in zip(self.relation_operands(), expected):
+            self.relation_test(lhs>rhs, val)
 
     def test_eq(self):
         #
         # Test the 'equals' operator
         #
-        a=self.create(1.3, Reals)
-        b=self.create(2.0, Reals)
-        self.relation_test(a==b, False, True)
-        self.relation_test(a==a, True, True)
-        self.relation_test(b==a, False, True)
-        self.relation_test(a==2.0, False, True)
-        self.relation_test(a==1.3, True, True)
-        self.relation_test(b==1.3, False, True)
-        self.relation_test(1.3==b, False, True)
-        self.relation_test(1.3==a, True, True)
-        self.relation_test(2.0==a, False, True)
+        expected = [False, True, False, False, True, False, False, True, False]
+        for (lhs, rhs), val in zip(self.relation_operands(), expected):
+            self.relation_test(lhs==rhs, val, True)
 
     def test_arithmetic(self):
         #
@@ -226,20 +233,11 @@ class TestExpression_EvaluateNumericConstant(unittest.TestCase):
 
 class TestExpression_EvaluateVarData(TestExpression_EvaluateNumericConstant):
 
-    def setUp(self):
-        import pyomo.core.base.var
-        #
-        # Create Model
-        #
-        TestExpression_EvaluateNumericConstant.setUp(self)
-        #
-        # Create model instance
-        #
-        self.expectExpression = True
-        self.expectConstExpression = False
+    expectExpression = True
+    expectConstExpression = False
 
     def create(self, val, domain):
-        tmp=pyomo.core.base.var._GeneralVarData()
+        tmp=_GeneralVarData()
         tmp.domain = domain
         tmp.value=val
         return tmp
@@ -247,42 +245,24 @@ class TestExpression_EvaluateVarData(TestExpression_EvaluateNumericConstant):
 
 class TestExpression_EvaluateVar(TestExpression_EvaluateNumericConstant):
 
-    def setUp(self):
-        import pyomo.core.base.var
-        #
-        # Create Model
-        #
-        TestExpression_EvaluateNumericConstant.setUp(self)
-        #
-        # Create model instance
-        #
-        self.expectExpression = True
-        self.expectConstExpression = False
+    expectExpression = True
+    expectConstExpression = False
 
     def create(self, val, domain):
-        tmp=Var(name="unknown",domain=domain)
-        tmp.construct()
+        tmp=_GeneralVarData()
+        tmp.domain = domain
         tmp.value=val
         return tmp
 
 
 class TestExpression_EvaluateFixedVar(TestExpression_EvaluateNumericConstant):
 
-    def setUp(self):
-        import pyomo.core.base.var
-        #
-        # Create Model
-        #
-        TestExpression_EvaluateNumericConstant.setUp(self)
-        #
-        # Create model instance
-        #
-        self.expectExpression = True
-        self.expectConstExpression = False
+    expectExpression = True
+    expectConstExpression = False
 
     def create(self, val, domain):
-        tmp=Var(name="unknown", domain=domain)
-        tmp.construct()
+        tmp=_GeneralVarData()
+        tmp.domain = domain
         tmp.fixed=True
         tmp.value=val
         return tmp
@@ -290,18 +270,6 @@ class TestExpression_EvaluateFixedVar(TestExpression_EvaluateNumericConstant):
 
 class TestExpression_EvaluateImmutableParam(TestExpression_EvaluateNumericConstant):
 
-    def setUp(self):
-        import pyomo.core.base.var
-        #
-        # Create Model
-        #
-        TestExpression_EvaluateNumericConstant.setUp(self)
-        #
-        # Create model instance
-        #
-        self.expectExpression = False
-        self.expectConstExpression = True
-
     def create(self, val, domain):
         tmp=Param(default=val, mutable=False, within=domain)
         tmp.construct()
@@ -310,17 +278,8 @@ class TestExpression_EvaluateImmutableParam(TestExpression_EvaluateNumericConsta
 
 class TestExpression_Evaluate_MutableParam(TestExpression_EvaluateNumericConstant):
 
-    def setUp(self):
-        import pyomo.core.base.var
-        #
-        # Create Model
-        #
-        TestExpression_EvaluateNumericConstant.setUp(self)
-        #
-        # Create model instance
-        #
-        self.expectExpression = True
-        self.expectConstExpression = False
+    expectExpression = True
+    expectConstExpression = False
 
     def create(self, val, domain):
         tmp=Param(default=val, mutable=True, within=domain)
@@ -590,7 +549,7 @@ class TestNumericValue(unittest.TestCase):
         #
         # Check that we can get the value from a numeric constant
         #
-        a = NumericConstant(1.1)
+        a = _constant(1.1)
         b = float(value(a))
         self.assertEqual(b,1.1)
         b = int(value(a))
@@ -600,9 +559,9 @@ class TestNumericValue(unittest.TestCase):
         #
         # Verify that we can compare the value of numeric constants
         #
-        a = NumericConstant(1.1)
-        b = NumericConstant(2.2)
-        c = NumericConstant(-2.2)
+        a = _constant(1.1)
+        b = _constant(2.2)
+        c = _constant(-2.2)
         #a <= b
         self.assertEqual(a() <= b(), True)
         self.assertEqual(a() >= b(), False)
@@ -627,20 +586,38 @@ class TestNumericValue(unittest.TestCase):
         self.assertEqual(e(exception=False), None)
 
 
-class TestGenerate_SumExpression(unittest.TestCase):
+class ExpressionTreeTestCase(unittest.TestCase):
+
+    def assertExpressionTree(self, e, etype, args, size):
+        """ Check the type, arguments and size of an expression. """
+        self.assertIs(type(e), etype)
+        self.assertEqual(e.nargs(), len(args))
+        for i, arg in enumerate(args):
+            if type(arg) in native_types:
+                self.assertEqual(e.arg(i), arg)
+            else:
+                self.assertIs(e.arg(i), arg)
+        self.assertEqual(e.size(), size)
+
+
+class TestGenerate_SumExpression(ExpressionTreeTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Building expressions does not modify the model, so the tests
+        # share a single model
+        cls.m = AbstractModel()
+        cls.m.a = Var()
+        cls.m.b = Var()
+        cls.m.c = Var()
+        cls.m.d = Var()
 
     def test_simpleSum(self):
         # a + b
-        m = AbstractModel()
-        m.a = Var()
-        m.b = Var()
+        m = self.m
         e = m.a + m.b
         #
-        self.assertIs(type(e), SumExpression)
-        self.assertEqual(e.nargs(), 2)
-        self.assertIs(e.arg(0), m.a)
-        self.assertIs(e.arg(1), m.b)
-        self.assertEqual(e.size(), 3)
+        self.assertExpressionTree(e, SumExpression, [m.a, m.b], 3)
 
         self.assertRaises(KeyError, e.arg, 3)
         self.assertIs(e.arg(-1), m.b)
@@ -651,7 +628,7 @@ class TestGenerate_SumExpression(unittest.TestCase):
         m.b = Var()
         e = m.a + m.b
         e += (2*m.a)
-        self.assertIs(e.nargs(), 3)
+        self.assertEqual(e.nargs(), 3)
         self.assertIs(e.arg(0), m.a)
         self.assertIs(e.arg(1), m.b)
         self.assertIs(type(e.arg(2)), MonomialTermExpression)
@@ -659,23 +636,14 @@ class TestGenerate_SumExpression(unittest.TestCase):
 
     def test_constSum(self):
         # a + 5
-        m = AbstractModel()
-        m.a = Var()
+        m = self.m
         e = m.a + 5
         #
-        self.assertIs(type(e), SumExpression)
-        self.assertEqual(e.nargs(), 2)
-        self.assertIs(e.arg(0), m.a)
-        self.assertIs(e.arg(1), 5)
-        self.assertEqual(e.size(), 3)
+        self.assertExpressionTree(e, SumExpression, [m.a, 5], 3)
 
         e = 5 + m.a
         #
-        self.assertIs(type(e), SumExpression)
-        self.assertEqual(e.nargs(), 2)
-        self.assertIs(e.arg(0), 5)
-        self.assertIs(e.arg(1), m.a)
-        self.assertEqual(e.size(), 3)
+        self.assertExpressionTree(e, SumExpression, [5, m.a], 3)
 
     def test_nestedSum(self):
         #
@@ -683,11 +651,7 @@ class TestGenerate_SumExpression(unittest.TestCase):
         #
         expectedType = SumExpression
 
-        m = AbstractModel()
-        m.a = Var()
-        m.b = Var()
-        m.c = Var()
-        m.d = Var()
+        m = self.m
 
         #           +
         #          / \
@@ -697,12 +661,7 @@ class TestGenerate_SumExpression(unittest.TestCase):
         e1 = m.a + m.b
         e = e1 + 5
         #
-        self.assertIs(type(e), expectedType)
-        self.assertEqual(e.nargs(), 3)
-        self.assertIs(e.arg(0), m.a)
-        self.assertIs(e.arg(1), m.b)
-        self.assertIs(e.arg(2), 5)
-        self.assertEqual(e.size(), 4)
+        self.assertExpressionTree(e, expectedType, [m.a, m.b, 5], 4)
 
         #       + 
         #      / \ 
@@ -712,12 +671,7 @@ class TestGenerate_SumExpression(unittest.TestCase):
         e1 = m.a + m.b
         e = 5 + e1
         #
-        self.assertIs(type(e), expectedType)
-        self.assertEqual(e.nargs(), 3)
-        self.assertIs(e.arg(0), m.a)
-        self.assertIs(e.arg(1), m.b)
-        self.assertIs(e.arg(2), 5)
-        self.assertEqual(e.size(), 4)
+        self.assertExpressionTree(e, expectedType, [m.a, m.b, 5], 4)
 
         #           +
         #          / \
@@ -727,12 +681,7 @@ class TestGenerate_SumExpression(unittest.TestCase):
         e1 = m.a + m.b
         e = e1 + m.c
         #
-        self.assertIs(type(e), expectedType)
-        self.assertEqual(e.nargs(), 3)
-        self.assertIs(e.arg(0), m.a)
-        self.assertIs(e.arg(1), m.b)
-        self.assertIs(e.arg(2), m.c)
-        self.assertEqual(e.size(), 4)
+        self.assertExpressionTree(e, expectedType, [m.a, m.b, m.c], 4)
 
         #       + 
         #      / \ 
@@ -742,12 +691,7 @@ class TestGenerate_SumExpression(unittest.TestCase):
         e1 = m.a + m.b
         e = m.c + e1
         #
-        self.assertIs(type(e), SumExpression)
-        self.assertEqual(e.nargs(), 3)
-        self.assertIs(e.arg(0), m.a)
-        self.assertIs(e.arg(1), m.b)
-        self.assertIs(e.arg(2), m.c)
-        self.assertEqual(e.size(), 4)
+        self.assertExpressionTree(e, SumExpression, [m.a, m.b, m.c], 4)
 
         #            +
         #          /   \
@@ -758,13 +702,7 @@ class TestGenerate_SumExpression(unittest.TestCase):
         e2 = m.c + m.d
         e = e1 + e2
         #
-        self.assertIs(type(e), expectedType)
-        self.assertEqual(e.nargs(), 4)
-        self.assertIs(e.arg(0), m.a)
-        self.assertIs(e.arg(1), m.b)
-        self.assertIs(e.arg(2), m.c)
-        self.assertIs(e.arg(3), m.d)
-        self.assertEqual(e.size(), 5)
+        self.assertExpressionTree(e, expectedType, [m.a, m.b, m.c, m.d], 5)
 
     def test_nestedSum2(self):
         #
@@ -772,11 +710,7 @@ class TestGenerate_SumExpression(unittest.TestCase):
         #
         expectedType = SumExpression
 
-        m = AbstractModel()
-        m.a = Var()
-        m.b = Var()
-        m.c = Var()
-        m.d = Var()
+        m = self.m
 
         #           +
         #          / \
@@ -816,8 +750,7 @@ class TestGenerate_SumExpression(unittest.TestCase):
         #
         # Check that adding zero doesn't change the expression
         #
-        m = AbstractModel()
-        m.a = Var()
+        m = self.m
         e = m.a + 0
         self.assertIs(type(e), type(m.a))
         self.assertIs(e, m.a)
@@ -836,10 +769,7 @@ class TestGenerate_SumExpression(unittest.TestCase):
         #
         # Check sums with nested products
         #
-        m = AbstractModel()
-        m.a = Var()
-        m.b = Var()
-        m.c = Var()
+        m = self.m
 
         #       +
         #      / \
@@ -851,7 +781,7 @@ class TestGenerate_SumExpression(unittest.TestCase):
         #
         self.assertIs(type(e), SumExpression)
         self.assertEqual(e.nargs(), 2)
-        self.assertIs(e.arg(0).arg(0), 5)
+        self.assertEqual(e.arg(0).arg(0), 5)
         self.assertIs(e.arg(0).arg(1), m.a)
         self.assertIs(e.arg(1), m.b)
         self.assertEqual(e.size(), 5)
@@ -866,7 +796,7 @@ class TestGenerate_SumExpression(unittest.TestCase):
         self.assertIs(type(e), SumExpression)
         self.assertEqual(e.nargs(), 2)
         self.assertIs(e.arg(0), m.b)
-        self.assertIs(e.arg(1).arg(0), 5)
+        self.assertEqual(e.arg(1).arg(0), 5)
         self.assertIs(e.arg(1).arg(1), m.a)
         self.assertEqual(e.size(), 5)
 
@@ -882,7 +812,7 @@ class TestGenerate_SumExpression(unittest.TestCase):
         self.assertEqual(e.nargs(), 3)
         self.assertIs(e.arg(0), m.b)
         self.assertIs(e.arg(1), m.c)
-        self.assertIs(e.arg(2).arg(0), 5)
+        self.assertEqual(e.arg(2).arg(0), 5)
         self.assertIs(e.arg(2).arg(1), m.a)
         self.assertEqual(e.size(), 6)
 
@@ -898,7 +828,7 @@ class TestGenerate_SumExpression(unittest.TestCase):
         self.assertEqual(e.nargs(), 3)
         self.assertIs(e.arg(0), m.b)
         self.assertIs(e.arg(1), m.c)
-        self.assertIs(e.arg(2).arg(0), 5)
+        self.assertEqual(e.arg(2).arg(0), 5)
         self.assertIs(e.arg(2).arg(1), m.a)
         self.assertEqual(e.size(), 6)
 
@@ -906,9 +836,7 @@ class TestGenerate_SumExpression(unittest.TestCase):
         #
         # Check the structure of a simple difference with two variables
         #
-        m = AbstractModel()
-        m.a = Var()
-        m.b = Var()
+        m = self.m
 
         #    -
         #   / \
@@ -925,8 +853,7 @@ class TestGenerate_SumExpression(unittest.TestCase):
         #
         # Check the structure of a simple difference with a constant
         #
-        m = AbstractModel()
-        m.a = Var()
+        m = self.m
 
         #    -
         #   / \
@@ -944,9 +871,9 @@ class TestGenerate_SumExpression(unittest.TestCase):
         e = 5 - m.a
         self.assertIs(type(e), SumExpression)
         self.assertEqual(e.nargs(), 2)
-        self.assertIs(e.arg(0), 5)
+        self.assertEqual(e.arg(0), 5)
         self.assertIs(type(e.arg(1)), MonomialTermExpression)
-        self.assertIs(e.arg(1).arg(0), -1)
+        self.assertEqual(e.arg(1).arg(0), -1)
         self.assertIs(e.arg(1).arg(1), m.a)
         self.assertEqual(e.size(), 5)
 
@@ -1032,11 +959,7 @@ class TestGenerate_SumExpression(unittest.TestCase):
         #
         # Check the structure of nested differences
         #
-        m = AbstractModel()
-        m.a = Var()
-        m.b = Var()
-        m.c = Var()
-        m.d = Var()
+        m = self.m
 
         #       -
         #      / \
@@ -1048,9 +971,9 @@ class TestGenerate_SumExpression(unittest.TestCase):
         self.assertIs(type(e), SumExpression)
         self.assertIs(e.arg(0), m.a)
         self.assertIs(e.arg(1).__class__, MonomialTermExpression)
-        self.assertIs(e.arg(1).arg(0), -1)
+        self.assertEqual(e.arg(1).arg(0), -1)
         self.assertIs(e.arg(1).arg(1), m.b)
-        self.assertIs(e.arg(2), -5)
+        self.assertEqual(e.arg(2), -5)
         self.assertEqual(e.size(), 6)
 
         #       -
@@ -1061,7 +984,7 @@ class TestGenerate_SumExpression(unittest.TestCase):
         e1 = m.a - m.b
         e = 5 - e1
         self.assertIs(type(e), SumExpression)
-        self.assertIs(e.arg(0), 5)
+        self.assertEqual(e.arg(0), 5)
         self.assertIs(type(e.arg(1)), NegationExpression)
         self.assertIs(e.arg(1).arg(0), e1)
         self.assertEqual(e.size(), 8)
@@ -1207,10 +1130,7 @@ class TestGenerate_SumExpression(unittest.TestCase):
         #
         # Check the structure of sum of products
         #
-        m = AbstractModel()
-        m.a = Var()
-        m.b = Var()
-        m.c = Var()
+        m = self.m
 
         #       -
         #      / \
@@ -1236,7 +1156,7 @@ class TestGenerate_SumExpression(unittest.TestCase):
         self.assertIs(type(e), SumExpression)
         self.assertEqual(e.nargs(), 2)
         self.assertIs(e.arg(0), m.b)
-        self.assertIs(e.arg(1).arg(0), -5)
+        self.assertEqual(e.arg(1).arg(0), -5)
         self.assertIs(e.arg(1).arg(1), m.a)
         self.assertEqual(e.size(), 5)
 
@@ -1267,7 +1187,7 @@ class TestGenerate_SumExpression(unittest.TestCase):
         self.assertIs(type(e.arg(1)), MonomialTermExpression)
         self.assertEqual(e.arg(1).arg(0), -1)
         self.assertIs(e.arg(1).arg(1), m.c)
-        self.assertIs(e.arg(2).arg(0), -5)
+        self.assertEqual(e.arg(2).arg(0), -5)
         self.assertIs(e.arg(2).arg(1), m.a)
         self.assertEqual(e.size(), 8)
 
@@ -1345,32 +1265,35 @@ class TestGenerate_SumExpression(unittest.TestCase):
         self.assertEqual(e.size(), 9)
 
 
-class TestGenerate_ProductExpression(unittest.TestCase):
+class TestGenerate_ProductExpression(ExpressionTreeTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Building expressions does not modify the model, so the tests
+        # share a single model
+        cls.m = AbstractModel()
+        cls.m.a = Var()
+        cls.m.b = Var()
+        cls.m.c = Var()
+        cls.m.d = Var()
 
     def test_simpleProduct(self):
         #
         # Check the structure of a simple product of variables
         #
-        m = AbstractModel()
-        m.a = Var()
-        m.b = Var()
+        m = self.m
 
         #    *
         #   / \
         #  a   b
         e = m.a * m.b
-        self.assertIs(type(e), ProductExpression)
-        self.assertEqual(e.nargs(), 2)
-        self.assertIs(e.arg(0), m.a)
-        self.assertIs(e.arg(1), m.b)
-        self.assertEqual(e.size(), 3)
+        self.assertExpressionTree(e, ProductExpression, [m.a, m.b], 3)
 
     def test_constProduct(self):
         #
         # Check the structure of a simple product with a constant
         #
-        m = AbstractModel()
-        m.a = Var()
+        m = self.m
 
         #    *
         #   / \
@@ -1386,21 +1309,13 @@ class TestGenerate_ProductExpression(unittest.TestCase):
         #   / \
         #  5   a
         e = 5 * m.a
-        self.assertIs(type(e), MonomialTermExpression)
-        self.assertEqual(e.nargs(), 2)
-        self.assertIs(e.arg(0), 5)
-        self.assertIs(e.arg(1), m.a)
-        self.assertEqual(e.size(), 3)
+        self.assertExpressionTree(e, MonomialTermExpression, [5, m.a], 3)
 
     def test_nestedProduct(self):
         #
         # Check the structure of nested products
         #
-        m = AbstractModel()
-        m.a = Var()
-        m.b = Var()
-        m.c = Var()
-        m.d = Var()
+        m = self.m
 
         #       *
         #      / \
@@ -1484,11 +1399,7 @@ class TestGenerate_ProductExpression(unittest.TestCase):
         #
         # Check the structure of nested products
         #
-        m = AbstractModel()
-        m.a = Var()
-        m.b = Var()
-        m.c = Var()
-        m.d = Var()
+        m = self.m
 
         #
         # Check the structure of nested products
@@ -1509,13 +1420,13 @@ class TestGenerate_ProductExpression(unittest.TestCase):
         self.assertEqual(e.nargs(), 2)
 
         self.assertIs(type(e.arg(0)), SumExpression)
-        self.assertIs(e.arg(0).nargs(), 3)
+        self.assertEqual(e.arg(0).nargs(), 3)
         self.assertIs(e.arg(0).arg(0), m.a)
         self.assertIs(e.arg(0).arg(1), m.b)
         self.assertIs(e.arg(0).arg(2), m.c)
 
         self.assertIs(type(e.arg(1)), SumExpression)
-        self.assertIs(e.arg(1).nargs(), 2)
+        self.assertEqual(e.arg(1).nargs(), 2)
         self.assertIs(e.arg(1).arg(1), m.d)
         self.assertEqual(e.size(), 10)
 
@@ -1540,20 +1451,20 @@ class TestGenerate_ProductExpression(unittest.TestCase):
         self.assertEqual(e.nargs(), 2)
 
         self.assertIs(type(e.arg(0)), ProductExpression)
-        self.assertIs(e.arg(0).nargs(), 2)
+        self.assertEqual(e.arg(0).nargs(), 2)
         self.assertIs(e.arg(0).arg(0), m.c)
 
         self.assertIs(type(e.arg(0).arg(1)), SumExpression)
-        self.assertIs(e.arg(0).arg(1).nargs(), 2)
+        self.assertEqual(e.arg(0).arg(1).nargs(), 2)
         self.assertIs(e.arg(0).arg(1).arg(0), m.a)
         self.assertIs(e.arg(0).arg(1).arg(1), m.b)
 
         self.assertIs(type(e.arg(1)), ProductExpression)
-        self.assertIs(e.arg(1).nargs(), 2)
+        self.assertEqual(e.arg(1).nargs(), 2)
         self.assertIs(e.arg(1).arg(1), m.d)
 
         self.assertIs(type(e.arg(1).arg(0)), SumExpression)
-        self.assertIs(e.arg(1).arg(0).nargs(), 2)
+        self.assertEqual(e.arg(1).arg(0).nargs(), 2)
         self.assertIs(e.arg(1).arg(0).arg(0), m.a)
         self.assertIs(e.arg(1).arg(0).arg(1), m.b)
         self.assertEqual(e.size(), 11)
@@ -1728,26 +1639,19 @@ class TestGenerate_ProductExpression(unittest.TestCase):
         #
         # Check the structure of a simple division with variables
         #
-        m = AbstractModel()
-        m.a = Var()
-        m.b = Var()
+        m = self.m
 
         #    /
         #   / \
         #  a   b
         e = m.a / m.b
-        self.assertIs(type(e), DivisionExpression)
-        self.assertEqual(e.nargs(), 2)
-        self.assertIs(e.arg(0), m.a)
-        self.assertIs(e.arg(1), m.b)
-        self.assertEqual(e.size(), 3)
+        self.assertExpressionTree(e, DivisionExpression, [m.a, m.b], 3)
 
     def test_constDivision(self):
         #
         # Check the structure of a simple division with a constant
         #
-        m = AbstractModel()
-        m.a = Var()
+        m = self.m
 
         #    /
         #   / \
@@ -1773,11 +1677,7 @@ class TestGenerate_ProductExpression(unittest.TestCase):
         #
         # Check the structure of nested divisions
         #
-        m = AbstractModel()
-        m.a = Var()
-        m.b = Var()
-        m.c = Var()
-        m.d = Var()
+        m = self.m
 
         #       /
         #      / \
@@ -1901,7 +1801,7 @@ class TestGenerate_ProductExpression(unittest.TestCase):
         e = 1 / m.a
         self.assertIs(type(e), DivisionExpression)
         self.assertEqual(e.nargs(), 2)
-        self.assertIs(e.arg(0), 1)
+        self.assertEqual(e.arg(0), 1)
         self.assertIs(e.arg(1), m.a)
 
         #
@@ -1943,13 +1843,15 @@ class TestPrettyPrinter_oldStyle(unittest.TestCase):
 
     _save = None
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         # This class tests the Pyomo 5.x expression trees
-        TestPrettyPrinter_oldStyle._save = expr_common.TO_STRING_VERBOSE
+        cls._save = expr_common.TO_STRING_VERBOSE
         expr_common.TO_STRING_VERBOSE = True
 
-    def tearDown(self):
-        expr_common.TO_STRING_VERBOSE = TestPrettyPrinter_oldStyle._save
+    @classmethod
+    def tearDownClass(cls):
+        expr_common.TO_STRING_VERBOSE = cls._save
 
     def test_sum(self):
         #
@@ -2121,13 +2023,15 @@ class TestPrettyPrinter_newStyle(unittest.TestCase):
 
     _save = None
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         # This class tests the Pyomo 5.x expression trees
-        TestPrettyPrinter_oldStyle._save = expr_common.TO_STRING_VERBOSE
+        cls._save = expr_common.TO_STRING_VERBOSE
         expr_common.TO_STRING_VERBOSE = False
 
-    def tearDown(self):
-        expr_common.TO_STRING_VERBOSE = TestPrettyPrinter_oldStyle._save
+    @classmethod
+    def tearDownClass(cls):
+        expr_common.TO_STRING_VERBOSE = cls._save
 
     def test_sum(self):
         #
@@ -2695,7 +2599,7 @@ class TestGeneralExpressionGeneration(unittest.TestCase):
         e = -m.a
         self.assertIs(type(e), MonomialTermExpression)
         self.assertEqual(e.nargs(), 2)
-        self.assertIs(e.arg(0), -1)
+        self.assertEqual(e.arg(0), -1)
         self.assertIs(e.arg(1), m.a)
 
         e1 = m.a - m.b
@@ -2725,23 +2629,21 @@ class TestExprConditionalContext(unittest.TestCase):
             logical_expr._chainedInequality.prev = None
 
     def checkCondition(self, expr, expectedValue):
-        try:
-            if expr:
-                if not logical_expr._using_chained_inequality and expectedValue != True:
-                    self.fail("__nonzero__ returned the wrong condition value"
-                              " (expected %s)" % expectedValue)
-            else:
-                if expectedValue != False:
-                    self.fail("__nonzero__ returned the wrong condition value"
-                              " (expected %s)" % expectedValue)
-            if expectedValue is None:
-                self.fail("Expected ValueError because component was undefined")
-        except ValueError:
-            if expectedValue is not None:
-                raise
-        finally:
-            if logical_expr._using_chained_inequality:
-                logical_expr._chainedInequality.prev = None
+        with reset_chained_inequality():
+            try:
+                if expr:
+                    if not logical_expr._using_chained_inequality and expectedValue != True:
+                        self.fail("__nonzero__ returned the wrong condition value"
+                                  " (expected %s)" % expectedValue)
+                else:
+                    if expectedValue != False:
+                        self.fail("__nonzero__ returned the wrong condition value"
+                                  " (expected %s)" % expectedValue)
+                if expectedValue is None:
+                    self.fail("Expected ValueError because component was undefined")
+            except ValueError:
+                if expectedValue is not None:
+                    raise
 
     def test_immutable_paramConditional(self):
         model = AbstractModel()
@@ -4824,6 +4726,14 @@ class Test_decompose_linear_terms(unittest.TestCase):
         self.assertEqual(decompose_term(-M.v),     (True, [(-1,M.v)]))
         self.assertEqual(decompose_term(-(2+M.v)), (True, [(-2,None), (-1,M.v)]))
 
+    def test_deep_nesting(self):
+        M = ConcreteModel()
+        M.v = Var()
+        e = M.v
+        for i in range(sys.getrecursionlimit()):
+            e = NegationExpression((NegationExpression((e,)),))
+        self.assertEqual(decompose_term(e), (True, [(1,M.v)]))
+
     def test_reciprocal(self):
         M = ConcreteModel()
         M.v = Var()